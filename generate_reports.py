@@ -2,8 +2,19 @@
 HTML Report Generator for FPL Analysis
 Generates comprehensive HTML reports and dashboard
 """
+import html
+import io
 import os
+import shutil
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
+
+import numpy as np
+import pandas as pd
+
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
 
 from src.api.fpl_client import FPLClient
 from src.analysis.player_analyzer import PlayerAnalyzer
@@ -12,268 +23,144 @@ from src.analysis.transfer_advisor import TransferAdvisor
 from datetime import datetime
 
 
-# CSS Styling
-STYLE = """
-<style>
-    * { margin: 0; padding: 0; box-sizing: border-box; }
-    body {
-        font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, sans-serif;
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        padding: 20px;
-        min-height: 100vh;
-    }
-    .container {
-        max-width: 1200px;
-        margin: 0 auto;
-        background: white;
-        border-radius: 15px;
-        box-shadow: 0 10px 40px rgba(0,0,0,0.2);
-        overflow: hidden;
-    }
-    .header {
-        background: linear-gradient(135deg, #37003c 0%, #4a0049 100%);
-        color: white;
-        padding: 40px;
-        text-align: center;
-    }
-    .header h1 { font-size: 2.5em; margin-bottom: 10px; }
-    .header p { color: #00ff87; font-size: 1.1em; }
-    .nav {
-        background: #f8f9fa;
-        padding: 20px;
-        border-bottom: 3px solid #37003c;
-    }
-    .nav a {
-        display: inline-block;
-        margin: 5px 10px;
-        padding: 10px 20px;
-        background: #37003c;
-        color: white;
-        text-decoration: none;
-        border-radius: 5px;
-        transition: background 0.3s;
-    }
-    .nav a:hover { background: #5c0061; }
-    .content { padding: 40px; }
-    .section {
-        background: #f8f9fa;
-        padding: 25px;
-        margin: 20px 0;
-        border-radius: 10px;
-        border-left: 5px solid #37003c;
-    }
-    .section h2 {
-        color: #37003c;
-        margin-bottom: 20px;
-        font-size: 1.8em;
-    }
-    .section h3 {
-        color: #5c0061;
-        margin: 20px 0 10px;
-        font-size: 1.3em;
-    }
-    table {
-        width: 100%;
-        border-collapse: collapse;
-        margin: 15px 0;
-        background: white;
-        box-shadow: 0 2px 8px rgba(0,0,0,0.1);
-    }
-    th {
-        background: #37003c;
-        color: white;
-        padding: 15px;
-        text-align: left;
-        font-weight: 600;
-    }
-    td {
-        padding: 12px 15px;
-        border-bottom: 1px solid #e0e0e0;
-    }
-    tr:hover { background: #f5f5f5; }
-    .highlight {
-        background: #00ff87;
-        color: #37003c;
-        padding: 3px 8px;
-        border-radius: 3px;
-        font-weight: bold;
-    }
-    .badge {
-        display: inline-block;
-        padding: 5px 10px;
-        border-radius: 15px;
-        font-size: 0.85em;
-        font-weight: bold;
-    }
-    .badge-success { background: #00ff87; color: #37003c; }
-    .badge-warning { background: #ffc107; color: #333; }
-    .badge-danger { background: #dc3545; color: white; }
-    .badge-info { background: #17a2b8; color: white; }
-    .stats-grid {
-        display: grid;
-        grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
-        gap: 20px;
-        margin: 20px 0;
-    }
-    .stat-card {
-        background: white;
-        padding: 25px;
-        border-radius: 10px;
-        text-align: center;
-        box-shadow: 0 2px 8px rgba(0,0,0,0.1);
-        border-top: 4px solid #37003c;
-    }
-    .stat-card h3 { color: #37003c; margin-bottom: 10px; }
-    .stat-card .value {
-        font-size: 2.5em;
-        font-weight: bold;
-        color: #00ff87;
-        text-shadow: 2px 2px 4px rgba(0,0,0,0.1);
-    }
-    .footer {
-        background: #f8f9fa;
-        padding: 30px;
-        text-align: center;
-        color: #666;
-        border-top: 3px solid #37003c;
-    }
-    .timestamp {
-        color: #999;
-        font-size: 0.9em;
-        margin-top: 10px;
-    }
-</style>
-"""
+TEMPLATE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "templates")
+STYLE_PATH = os.path.join(TEMPLATE_DIR, "style.css")
+BYTECODE_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".jinja_bc")
+
+# Large enough that a typical report is flushed in a handful of write() calls
+WRITE_BUFFER_SIZE = 1 << 18
+
+# DataFrame.to_html's default float precision
+FLOAT_DIGITS = 6
+
+
+def _format_float_column(values: np.ndarray) -> List[str]:
+    """
+    Format a float column the way DataFrame.to_html does
+
+    Every value gets the same number of decimals: the fewest that show all of
+    them to FLOAT_DIGITS places, but at least one. Columns with tiny values,
+    or huge values too wide for fixed notation, use scientific notation.
+
+    Args:
+        values: Float values of one column
+
+    Returns:
+        Formatted cell strings, with "NaN" for missing values
+    """
+    missing = np.isnan(values)
+    cells = [f'{v:.{FLOAT_DIGITS}f}' for v in values.tolist()]
+    present = [i for i, m in enumerate(missing.tolist()) if not m]
+    numbers = [i for i in present if '.' in cells[i]]
+    # Drop trailing zeros the whole column shares
+    while numbers and all(cells[i].endswith('0') for i in numbers):
+        for i in numbers:
+            cells[i] = cells[i][:-1]
+    for i in numbers:
+        if cells[i].endswith('.'):
+            cells[i] += '0'
+
+    abs_values = np.abs(values[~missing])
+    has_small = ((abs_values < 10 ** -FLOAT_DIGITS) & (abs_values > 0)).any()
+    too_long = max((len(cells[i]) for i in present), default=0) > FLOAT_DIGITS + 6
+    if has_small or (too_long and (abs_values > 1e6).any()):
+        cells = [f'{v:.{FLOAT_DIGITS}e}' for v in values.tolist()]
+
+    for i in np.flatnonzero(missing).tolist():
+        cells[i] = 'NaN'
+    return cells
+
+
+def df_to_html_fast(df: pd.DataFrame, classes: str = 'data-table') -> str:
+    """
+    Render a DataFrame as an HTML table without DataFrame.to_html
+
+    Args:
+        df: DataFrame to render (index is not included)
+        classes: CSS classes for the table element
+
+    Returns:
+        HTML table markup
+    """
+    buf = io.StringIO()
+    buf.write(f'<table class="dataframe {classes}">\n<thead>\n<tr>')
+    buf.write(''.join(f'<th>{html.escape(str(c))}</th>' for c in df.columns))
+    buf.write('</tr>\n</thead>\n<tbody>\n')
+    columns = [
+        _format_float_column(df[c].to_numpy()) if df[c].dtype.kind == 'f'
+        else [html.escape(str(v)) for v in df[c]]
+        for c in df.columns
+    ]
+    for row in zip(*columns):
+        buf.write('<tr>')
+        buf.write(''.join(f'<td>{v}</td>' for v in row))
+        buf.write('</tr>\n')
+    buf.write('</tbody>\n</table>')
+    return buf.getvalue()
+
+
+# Single environment per process so each template is parsed and compiled once;
+# built on first use so importing this module has no side effects
+_ENV: Optional[Environment] = None
+_ENV_LOCK = threading.Lock()
+
+
+def _get_env() -> Environment:
+    """
+    Get the shared template environment, creating it on first use
+
+    Returns:
+        Jinja environment, with a bytecode cache that lets later runs skip
+        template compilation when its directory can be created
+    """
+    global _ENV
+    with _ENV_LOCK:
+        if _ENV is None:
+            try:
+                os.makedirs(BYTECODE_CACHE_DIR, exist_ok=True)
+                bytecode_cache = FileSystemBytecodeCache(BYTECODE_CACHE_DIR)
+            except OSError:
+                # e.g. a read-only install; templates are compiled every run
+                bytecode_cache = None
+            env = Environment(
+                loader=FileSystemLoader(TEMPLATE_DIR),
+                bytecode_cache=bytecode_cache,
+                auto_reload=False,
+                cache_size=400
+            )
+            env.filters['html_table'] = df_to_html_fast
+            _ENV = env
+        return _ENV
+
+
+def _write_style_once():
+    """Copy the shared stylesheet next to the reports that link to it"""
+    os.makedirs("reports", exist_ok=True)
+    shutil.copyfile(STYLE_PATH, os.path.join("reports", "style.css"))
 
 
 def generate_dashboard():
     """Generate main dashboard index.html"""
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
-    html = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>FPL Analysis Dashboard</title>
-    {STYLE}
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <h1>⚽ FPL Analysis Dashboard</h1>
-            <p>Fantasy Premier League - Complete Analysis Suite</p>
-        </div>
-
-        <div class="nav">
-            <a href="index.html">🏠 Dashboard</a>
-            <a href="players.html">👤 Player Analysis</a>
-            <a href="fixtures.html">📅 Fixture Analysis</a>
-            <a href="transfers.html">🔄 Transfer Recommendations</a>
-            <a href="phase1_report.html">📦 Phase 1</a>
-            <a href="phase4_comprehensive_tests.log">🧪 Test Results</a>
-        </div>
-
-        <div class="content">
-            <div class="section">
-                <h2>🎯 Project Overview</h2>
-                <p>Welcome to the FPL Analysis Project - a comprehensive Fantasy Premier League analysis tool built entirely in Termux on Android!</p>
-
-                <div class="stats-grid">
-                    <div class="stat-card">
-                        <h3>Players Analyzed</h3>
-                        <div class="value">760</div>
-                    </div>
-                    <div class="stat-card">
-                        <h3>Teams Tracked</h3>
-                        <div class="value">20</div>
-                    </div>
-                    <div class="stat-card">
-                        <h3>Fixtures</h3>
-                        <div class="value">380</div>
-                    </div>
-                    <div class="stat-card">
-                        <h3>Current GW</h3>
-                        <div class="value">16</div>
-                    </div>
-                </div>
-            </div>
-
-            <div class="section">
-                <h2>📊 Available Reports</h2>
-                <table>
-                    <tr>
-                        <th>Report</th>
-                        <th>Description</th>
-                        <th>Action</th>
-                    </tr>
-                    <tr>
-                        <td><strong>Player Analysis</strong></td>
-                        <td>Top form players, best value picks, and differential options</td>
-                        <td><a href="players.html" style="color: #37003c;">View Report →</a></td>
-                    </tr>
-                    <tr>
-                        <td><strong>Fixture Analysis</strong></td>
-                        <td>Upcoming fixtures, difficulty ratings, and fixture ticker</td>
-                        <td><a href="fixtures.html" style="color: #37003c;">View Report →</a></td>
-                    </tr>
-                    <tr>
-                        <td><strong>Transfer Recommendations</strong></td>
-                        <td>Transfer targets, sell candidates, and captaincy picks</td>
-                        <td><a href="transfers.html" style="color: #37003c;">View Report →</a></td>
-                    </tr>
-                </table>
-            </div>
-
-            <div class="section">
-                <h2>✅ Project Status</h2>
-                <ul style="line-height: 2; list-style: none; padding-left: 20px;">
-                    <li>✅ <strong>Phase 1:</strong> Project setup and dependencies - <span class="highlight">COMPLETE</span></li>
-                    <li>✅ <strong>Phase 2:</strong> FPL API Client - <span class="highlight">COMPLETE</span></li>
-                    <li>✅ <strong>Phase 3:</strong> Analysis Modules - <span class="highlight">COMPLETE</span></li>
-                    <li>✅ <strong>Phase 4:</strong> Comprehensive Testing - <span class="highlight">ALL TESTS PASSED</span></li>
-                    <li>✅ <strong>Phase 5:</strong> HTML Reports & Dashboard - <span class="highlight">COMPLETE</span></li>
-                </ul>
-            </div>
-
-            <div class="section">
-                <h2>🛠️ Technical Stack</h2>
-                <div class="stats-grid">
-                    <div class="stat-card">
-                        <h3>Python</h3>
-                        <div class="value" style="font-size: 1.5em;">3.12.12</div>
-                    </div>
-                    <div class="stat-card">
-                        <h3>Environment</h3>
-                        <div class="value" style="font-size: 1.2em;">Termux</div>
-                    </div>
-                    <div class="stat-card">
-                        <h3>Libraries</h3>
-                        <div class="value" style="font-size: 1.2em;">Pandas + Requests</div>
-                    </div>
-                </div>
-            </div>
-        </div>
-
-        <div class="footer">
-            <p><strong>FPL Analysis Project</strong> - Built with Python in Termux</p>
-            <p class="timestamp">Generated: {timestamp}</p>
-        </div>
-    </div>
-</body>
-</html>"""
+    template = _get_env().get_template("dashboard.html")
 
     output_path = os.path.join("reports", "index.html")
     os.makedirs("reports", exist_ok=True)
-    with open(output_path, 'w') as f:
-        f.write(html)
+    with open(output_path, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
+        template.stream(timestamp=timestamp).dump(f)
 
     print(f"✅ Dashboard generated: {output_path}")
 
 
-def generate_player_report():
-    """Generate player analysis report"""
-    analyzer = PlayerAnalyzer()
+def generate_player_report(analyzer: Optional[PlayerAnalyzer] = None):
+    """
+    Generate player analysis report
+
+    Args:
+        analyzer: Shared PlayerAnalyzer (creates new one if not provided)
+    """
+    analyzer = analyzer if analyzer else PlayerAnalyzer()
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
     # Get data
@@ -281,145 +168,60 @@ def generate_player_report():
     best_value = analyzer.get_best_value_players(10, max_price=7.0)
     differentials = analyzer.get_differential_picks(10)
 
-    # Convert dataframes to HTML tables
-    form_table = top_form.to_html(index=False, classes='data-table', border=0)
-    value_table = best_value.to_html(index=False, classes='data-table', border=0)
-    diff_table = differentials.to_html(index=False, classes='data-table', border=0)
-
-    html = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Player Analysis Report</title>
-    {STYLE}
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <h1>👤 Player Analysis Report</h1>
-            <p>Top performers, value picks, and differentials</p>
-        </div>
-
-        <div class="nav">
-            <a href="index.html">🏠 Dashboard</a>
-            <a href="players.html">👤 Player Analysis</a>
-            <a href="fixtures.html">📅 Fixtures</a>
-            <a href="transfers.html">🔄 Transfers</a>
-        </div>
-
-        <div class="content">
-            <div class="section">
-                <h2>🔥 Top Form Players</h2>
-                <p>Players in the best current form based on recent performances:</p>
-                {form_table}
-            </div>
-
-            <div class="section">
-                <h2>💰 Best Value Players (Under £7.0m)</h2>
-                <p>Budget-friendly options with excellent points per million:</p>
-                {value_table}
-            </div>
-
-            <div class="section">
-                <h2>🎯 Differential Picks</h2>
-                <p>Low ownership players with strong potential (under 5% ownership):</p>
-                {diff_table}
-            </div>
-        </div>
-
-        <div class="footer">
-            <p><strong>FPL Analysis Project</strong></p>
-            <p class="timestamp">Generated: {timestamp}</p>
-        </div>
-    </div>
-</body>
-</html>"""
+    template = _get_env().get_template("players.html")
 
+    # The page streams to disk, but each table is built as one string first
     output_path = os.path.join("reports", "players.html")
-    with open(output_path, 'w') as f:
-        f.write(html)
+    with open(output_path, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
+        template.stream(
+            active='players',
+            top_form=top_form,
+            best_value=best_value,
+            differentials=differentials,
+            timestamp=timestamp
+        ).dump(f)
 
     print(f"✅ Player report generated: {output_path}")
 
 
-def generate_fixture_report():
-    """Generate fixture analysis report"""
-    analyzer = FixtureAnalyzer()
+def generate_fixture_report(analyzer: Optional[FixtureAnalyzer] = None):
+    """
+    Generate fixture analysis report
+
+    Args:
+        analyzer: Shared FixtureAnalyzer (creates new one if not provided)
+    """
+    analyzer = analyzer if analyzer else FixtureAnalyzer()
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
     # Get data
-    best_fixtures = analyzer.get_best_fixtures(5)
-    worst_fixtures = analyzer.get_worst_fixtures(5)
+    best_fixtures = analyzer.get_best_fixtures(5).head(10)
+    worst_fixtures = analyzer.get_worst_fixtures(5).head(10)
     ticker = analyzer.get_fixture_ticker(5)
 
-    # Convert to HTML
-    best_table = best_fixtures.head(10).to_html(index=False, classes='data-table', border=0)
-    worst_table = worst_fixtures.head(10).to_html(index=False, classes='data-table', border=0)
-    ticker_table = ticker.to_html(index=False, classes='data-table', border=0)
-
-    html = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Fixture Analysis Report</title>
-    {STYLE}
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <h1>📅 Fixture Analysis Report</h1>
-            <p>Upcoming fixtures and difficulty ratings</p>
-        </div>
-
-        <div class="nav">
-            <a href="index.html">🏠 Dashboard</a>
-            <a href="players.html">👤 Players</a>
-            <a href="fixtures.html">📅 Fixture Analysis</a>
-            <a href="transfers.html">🔄 Transfers</a>
-        </div>
-
-        <div class="content">
-            <div class="section">
-                <h2>✅ Best Upcoming Fixtures (Next 5 GWs)</h2>
-                <p>Teams with the easiest fixtures ahead:</p>
-                {best_table}
-            </div>
-
-            <div class="section">
-                <h2>⚠️ Worst Upcoming Fixtures (Next 5 GWs)</h2>
-                <p>Teams with the toughest fixtures ahead:</p>
-                {worst_table}
-            </div>
-
-            <div class="section">
-                <h2>📊 Fixture Ticker</h2>
-                <p>Complete fixture overview for all teams (H=Home, A=Away, [Difficulty]):</p>
-                <div style="overflow-x: auto;">
-                    {ticker_table}
-                </div>
-            </div>
-        </div>
-
-        <div class="footer">
-            <p><strong>FPL Analysis Project</strong></p>
-            <p class="timestamp">Generated: {timestamp}</p>
-        </div>
-    </div>
-</body>
-</html>"""
+    template = _get_env().get_template("fixtures.html")
 
     output_path = os.path.join("reports", "fixtures.html")
-    with open(output_path, 'w') as f:
-        f.write(html)
+    with open(output_path, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
+        template.stream(
+            active='fixtures',
+            best_fixtures=best_fixtures,
+            worst_fixtures=worst_fixtures,
+            ticker=ticker,
+            timestamp=timestamp
+        ).dump(f)
 
     print(f"✅ Fixture report generated: {output_path}")
 
 
-def generate_transfer_report():
-    """Generate transfer recommendations report"""
-    advisor = TransferAdvisor()
+def generate_transfer_report(advisor: Optional[TransferAdvisor] = None):
+    """
+    Generate transfer recommendations report
+
+    Args:
+        advisor: Shared TransferAdvisor (creates new one if not provided)
+    """
+    advisor = advisor if advisor else TransferAdvisor()
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
     # Get data
@@ -428,76 +230,18 @@ def generate_transfer_report():
     captains = advisor.get_captaincy_picks(10)
     chips = advisor.analyze_chip_strategy()
 
-    # Convert to HTML
-    targets_table = targets.to_html(index=False, classes='data-table', border=0)
-    sell_table = sell_candidates.to_html(index=False, classes='data-table', border=0)
-    captain_table = captains.to_html(index=False, classes='data-table', border=0)
-
-    html = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Transfer Recommendations</title>
-    {STYLE}
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <h1>🔄 Transfer Recommendations</h1>
-            <p>Smart transfer targets and captaincy picks</p>
-        </div>
-
-        <div class="nav">
-            <a href="index.html">🏠 Dashboard</a>
-            <a href="players.html">👤 Players</a>
-            <a href="fixtures.html">📅 Fixtures</a>
-            <a href="transfers.html">🔄 Transfer Recommendations</a>
-        </div>
-
-        <div class="content">
-            <div class="section">
-                <h2>⭐ Top Transfer Targets</h2>
-                <p>Best players to bring in based on form, fixtures, and value:</p>
-                {targets_table}
-            </div>
-
-            <div class="section">
-                <h2>👋 Transfer Out Candidates</h2>
-                <p>Players to consider selling due to poor form or tough fixtures:</p>
-                {sell_table}
-            </div>
-
-            <div class="section">
-                <h2>©️ Captain Picks for Next GW</h2>
-                <p>Recommended captaincy choices for gameweek {chips['current_gameweek'] + 1}:</p>
-                {captain_table}
-            </div>
-
-            <div class="section">
-                <h2>🎴 Chip Strategy</h2>
-                <ul style="line-height: 2; padding-left: 20px;">
-                    <li><strong>Current Gameweek:</strong> {chips['current_gameweek']}</li>
-                    <li><strong>Wildcard:</strong> {chips['wildcard_recommendation']}</li>
-                    <li><strong>Best Fixture Teams:</strong> {', '.join(chips['best_fixture_teams'])}</li>
-                    <li><strong>Bench Boost GWs:</strong> {', '.join(map(str, chips['bench_boost_gameweeks'])) if chips['bench_boost_gameweeks'] else 'None identified'}</li>
-                    <li><strong>Triple Captain GWs:</strong> {', '.join(map(str, chips['triple_captain_gameweeks'])) if chips['triple_captain_gameweeks'] else 'None identified'}</li>
-                    <li><strong>Free Hit GWs:</strong> {', '.join(map(str, chips['free_hit_gameweeks'])) if chips['free_hit_gameweeks'] else 'None identified'}</li>
-                </ul>
-            </div>
-        </div>
-
-        <div class="footer">
-            <p><strong>FPL Analysis Project</strong></p>
-            <p class="timestamp">Generated: {timestamp}</p>
-        </div>
-    </div>
-</body>
-</html>"""
+    template = _get_env().get_template("transfers.html")
 
     output_path = os.path.join("reports", "transfers.html")
-    with open(output_path, 'w') as f:
-        f.write(html)
+    with open(output_path, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
+        template.stream(
+            active='transfers',
+            targets=targets,
+            sell_candidates=sell_candidates,
+            captains=captains,
+            chips=chips,
+            timestamp=timestamp
+        ).dump(f)
 
     print(f"✅ Transfer report generated: {output_path}")
 
@@ -507,10 +251,26 @@ if __name__ == "__main__":
     print("Generating HTML Reports...")
     print("="*60 + "\n")
 
-    generate_dashboard()
-    generate_player_report()
-    generate_fixture_report()
-    generate_transfer_report()
+    _write_style_once()
+
+    # Fetch and prepare the API data once, shared by every report; both
+    # payloads are requested in parallel while the analyzers start up
+    client = FPLClient(prefetch=True)
+    player_analyzer = PlayerAnalyzer(client)
+    fixture_analyzer = FixtureAnalyzer(client, player_analyzer)
+    advisor = TransferAdvisor(client, player_analyzer, fixture_analyzer)
+
+    # Analyzers are fully loaded at this point, so the reports only read
+    # shared data and can be rendered and written concurrently
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [
+            executor.submit(generate_dashboard),
+            executor.submit(generate_player_report, player_analyzer),
+            executor.submit(generate_fixture_report, fixture_analyzer),
+            executor.submit(generate_transfer_report, advisor)
+        ]
+        for future in futures:
+            future.result()
 
     print("\n" + "="*60)
     print("✅ ALL REPORTS GENERATED SUCCESSFULLY!")
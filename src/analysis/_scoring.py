@@ -0,0 +1,79 @@
+"""
+Scoring Kernels
+Fused element-wise score formulas over raw numpy arrays
+"""
+import numpy as np
+
+
+def transfer_score(form: np.ndarray, points_per_million: np.ndarray,
+                   fixture_score: np.ndarray) -> np.ndarray:
+    """
+    Form (40%) + Value (30%) + Fixtures (30%)
+
+    Args:
+        form: Player form
+        points_per_million: Total points per £1m
+        fixture_score: Inverted upcoming fixture difficulty (5 - avg_difficulty)
+
+    Returns:
+        Transfer score rounded to 2 decimals
+    """
+    score = form * 4
+    score += points_per_million * 0.3
+    score += fixture_score * 3
+    return np.round(score, 2, out=score)
+
+
+def sell_score(form: np.ndarray, fixture_difficulty: np.ndarray,
+               value: np.ndarray, available: np.ndarray) -> np.ndarray:
+    """
+    Poor form + tough fixtures + high price, boosted for unavailable players
+
+    Args:
+        form: Player form
+        fixture_difficulty: Average upcoming fixture difficulty
+        value: Price in millions
+        available: Boolean availability mask
+
+    Returns:
+        Sell score rounded to 2 decimals
+    """
+    score = (5 - form) * 2
+    score += fixture_difficulty * 2
+    score += value * 0.5
+    score[~available] *= 1.5
+    return np.round(score, 2, out=score)
+
+
+def captain_score(form: np.ndarray, fixture_score: np.ndarray,
+                  points_per_game: np.ndarray) -> np.ndarray:
+    """
+    Form (50%) + Fixtures (40%) + Points per game (10%)
+
+    Args:
+        form: Player form
+        fixture_score: Inverted next fixture difficulty (5 - difficulty)
+        points_per_game: Points per game
+
+    Returns:
+        Captain score rounded to 2 decimals
+    """
+    score = form * 5
+    score += fixture_score * 4
+    score += points_per_game
+    return np.round(score, 2, out=score)
+
+
+def diff_score(points_per_million: np.ndarray, form: np.ndarray) -> np.ndarray:
+    """
+    Points per million weighted by form
+
+    Args:
+        points_per_million: Total points per £1m
+        form: Player form
+
+    Returns:
+        Differential score rounded to 2 decimals
+    """
+    score = points_per_million * form
+    return np.round(score, 2, out=score)
@@ -2,26 +2,46 @@
 Fixture Analyzer
 Analyzes team fixtures and difficulty ratings
 """
+import argparse
+import numpy as np
 import pandas as pd
-from typing import List, Dict, Optional
-import sys
-sys.path.append('/data/data/com.termux/files/home/fpl_project')
-from src.api.fpl_client import FPLClient
+from typing import TYPE_CHECKING, Any, Callable, List, Dict, Optional
+
+if TYPE_CHECKING:
+    from src.api.fpl_client import FPLClient
+    from src.analysis.player_analyzer import PlayerAnalyzer
+
+
+# Fixture ticker cell suffixes, precomputed for every venue/difficulty pair
+TICKER_SUFFIX = {
+    (venue, difficulty): f"({venue})[{difficulty}]"
+    for venue in 'HA' for difficulty in range(1, 6)
+}
 
 
 class FixtureAnalyzer:
     """Analyzes FPL fixtures and team schedules"""
 
-    def __init__(self, client: Optional[FPLClient] = None):
+    def __init__(self, client: Optional['FPLClient'] = None,
+                 player_analyzer: Optional['PlayerAnalyzer'] = None):
         """
         Initialize analyzer
 
         Args:
             client: FPLClient instance
+            player_analyzer: Loaded PlayerAnalyzer whose teams_df is reused
+                (team data is built from the bootstrap payload if not provided)
         """
-        self.client = client if client else FPLClient()
+        if client is None:
+            # Imported lazily so callers passing their own client skip the API module
+            from src.api.fpl_client import FPLClient
+            client = FPLClient()
+        self.client = client
+        self.player_analyzer = player_analyzer
         self.fixtures_df = None
         self.teams_df = None
+        self.upcoming_df = None
+        self.team_fixtures_df = None
         self._load_data()
 
     def _load_data(self):
@@ -30,21 +50,126 @@ class FixtureAnalyzer:
         fixtures = self.client.get_fixtures()
         self.fixtures_df = pd.DataFrame(fixtures)
 
-        # Get teams
-        data = self.client.get_bootstrap_static()
-        self.teams_df = pd.DataFrame(data['teams'])
+        # Get teams, reusing the player analyzer's table when one is attached
+        if self.player_analyzer is not None:
+            self.teams_df = self.player_analyzer.teams_df
+        else:
+            data = self.client.get_bootstrap_static()
+            self.teams_df = pd.DataFrame(data['teams'])
+
+        # Add home/away team names and short names with one join per side
+        teams_small = self.teams_df[['id', 'name', 'short_name']]
+        self.fixtures_df = self.fixtures_df.merge(
+            teams_small.rename(columns={
+                'id': 'team_h', 'name': 'home_team_name', 'short_name': 'home_short'
+            }),
+            on='team_h', how='left'
+        ).merge(
+            teams_small.rename(columns={
+                'id': 'team_a', 'name': 'away_team_name', 'short_name': 'away_short'
+            }),
+            on='team_a', how='left'
+        )
+
+        # Compact dtypes: ids and difficulties fit in int8 and team names are
+        # low-cardinality. Unscheduled fixtures have no gameweek, hence nullable Int8
+        name_dtype = pd.CategoricalDtype(self.teams_df['name'].unique())
+        short_dtype = pd.CategoricalDtype(self.teams_df['short_name'].unique())
+        self.fixtures_df = self.fixtures_df.astype({
+            'event': 'Int8',
+            'team_h': 'int8',
+            'team_a': 'int8',
+            'team_h_difficulty': 'int8',
+            'team_a_difficulty': 'int8',
+            'home_team_name': name_dtype,
+            'away_team_name': name_dtype,
+            'home_short': short_dtype,
+            'away_short': short_dtype,
+            'finished': 'bool'
+        })
+
+        # Case-folded full and short names for exact team lookups
+        self._name_to_id = {}
+        for team_id, name, short_name in zip(
+            self.teams_df['id'], self.teams_df['name'], self.teams_df['short_name']
+        ):
+            self._name_to_id[name.lower()] = team_id
+            self._name_to_id[short_name.lower()] = team_id
+
+        # Unfinished fixtures, shared read-only by every upcoming-fixture query
+        self.upcoming_df = self.fixtures_df.loc[~self.fixtures_df['finished']].reset_index(drop=True)
+        self.team_fixtures_df = self._build_team_fixtures()
+
+        # Row positions of each team's fixtures, already in gameweek order
+        self._team_fixture_index = self.team_fixtures_df.groupby('team').indices
+
+        # Derived fixture tables keyed by query and arguments, rebuilt on refresh
+        self._query_cache: Dict[tuple, Any] = {}
+
+    def _cached(self, key: tuple, compute: Callable[[], Any]) -> Any:
+        """
+        Return a derived table, computing it on first use
+
+        Args:
+            key: Query name and arguments
+            compute: Builds the table from the loaded fixture data
+
+        Returns:
+            Cached result (callers must copy before handing it out)
+        """
+        if key not in self._query_cache:
+            self._query_cache[key] = compute()
+        return self._query_cache[key]
+
+    def _build_team_fixtures(self) -> pd.DataFrame:
+        """
+        Build one row per team per upcoming fixture
+
+        Returns:
+            DataFrame with team, opponent, venue, difficulty and an
+            "OPP(H)" label, sorted by gameweek
+        """
+        df = self.upcoming_df
+
+        home = df.assign(
+            team=df['team_h'], team_name=df['home_team_name'],
+            opponent=df['away_short'], difficulty=df['team_h_difficulty'], venue='H'
+        )
+        away = df.assign(
+            team=df['team_a'], team_name=df['away_team_name'],
+            opponent=df['home_short'], difficulty=df['team_a_difficulty'], venue='A'
+        )
 
-        # Create team name mapping
-        team_map = dict(zip(self.teams_df['id'], self.teams_df['name']))
+        long = pd.concat([home, away], ignore_index=True)
+        long['label'] = long['opponent'].astype(str) + '(' + long['venue'] + ')'
 
-        # Add team names to fixtures
-        self.fixtures_df['home_team_name'] = self.fixtures_df['team_h'].map(team_map)
-        self.fixtures_df['away_team_name'] = self.fixtures_df['team_a'].map(team_map)
+        return long.sort_values('event', kind='stable').reset_index(drop=True)
 
-        # Add short names
-        short_map = dict(zip(self.teams_df['id'], self.teams_df['short_name']))
-        self.fixtures_df['home_short'] = self.fixtures_df['team_h'].map(short_map)
-        self.fixtures_df['away_short'] = self.fixtures_df['team_a'].map(short_map)
+    def _resolve_team_id(self, team_name: str) -> Optional[int]:
+        """
+        Resolve a team name to its ID
+
+        Args:
+            team_name: Full or short team name (falls back to partial match)
+
+        Returns:
+            Team ID, or None if no team or more than one team matches partially
+        """
+        key = team_name.lower()
+        if key in self._name_to_id:
+            return self._name_to_id[key]
+
+        # A partial name such as "man" can match several teams; rather than
+        # picking whichever comes first, only accept it if it is unambiguous
+        matches = {team_id for name, team_id in self._name_to_id.items() if key in name}
+        return matches.pop() if len(matches) == 1 else None
+
+    def _get_team_fixtures(self, team_name: str, n: Optional[int] = None) -> pd.DataFrame:
+        """Get the next n upcoming team-fixture rows for a team, in gameweek order"""
+        positions = self._team_fixture_index.get(self._resolve_team_id(team_name))
+        if positions is None:
+            return self.team_fixtures_df.iloc[:0]
+        return self.team_fixtures_df.iloc[positions[:n]]
 
     def get_upcoming_fixtures(self, team_name: str, n: int = 5) -> pd.DataFrame:
         """
@@ -57,26 +182,14 @@ class FixtureAnalyzer:
         Returns:
             DataFrame of upcoming fixtures
         """
-        df = self.fixtures_df.copy()
-
-        # Filter for the team (home or away)
-        df = df[
-            (df['home_team_name'].str.contains(team_name, case=False)) |
-            (df['away_team_name'].str.contains(team_name, case=False))
-        ]
-
-        # Filter only future fixtures (not finished)
-        df = df[df['finished'] == False]
-
-        # Sort by gameweek
-        df = df.sort_values('event')
+        df = self._get_team_fixtures(team_name, n)
 
         columns = [
             'event', 'home_short', 'away_short',
             'team_h_difficulty', 'team_a_difficulty'
         ]
 
-        return df[columns].head(n).reset_index(drop=True)
+        return df[columns].reset_index(drop=True)
 
     def get_fixture_difficulty(self, team_name: str, n: int = 5) -> Dict:
         """
@@ -89,40 +202,58 @@ class FixtureAnalyzer:
         Returns:
             Dictionary with difficulty analysis
         """
-        fixtures = self.get_upcoming_fixtures(team_name, n)
+        fixtures = self._get_team_fixtures(team_name, n)
 
         if fixtures.empty:
             return {'team': team_name, 'avg_difficulty': 0, 'fixtures': []}
 
-        # Determine if team is home or away and get appropriate difficulty
-        difficulties = []
-        fixture_list = []
-
-        for _, row in fixtures.iterrows():
-            if team_name.lower() in row['home_short'].lower():
-                difficulty = row['team_h_difficulty']
-                opponent = row['away_short']
-                venue = 'H'
-            else:
-                difficulty = row['team_a_difficulty']
-                opponent = row['home_short']
-                venue = 'A'
-
-            difficulties.append(difficulty)
-            fixture_list.append({
-                'gameweek': row['event'],
-                'opponent': opponent,
-                'venue': venue,
-                'difficulty': difficulty
-            })
+        fixture_list = fixtures[['event', 'opponent', 'venue', 'difficulty']].rename(
+            columns={'event': 'gameweek'}
+        ).to_dict('records')
+
+        difficulties = fixtures['difficulty'].to_numpy(dtype=np.int8)
 
         return {
             'team': team_name,
-            'avg_difficulty': round(sum(difficulties) / len(difficulties), 2),
-            'total_difficulty': sum(difficulties),
+            'avg_difficulty': round(float(difficulties.mean()), 2),
+            'total_difficulty': int(difficulties.sum()),
             'fixtures': fixture_list
         }
 
+    def get_all_team_difficulties(self, n_games: int = 5) -> pd.Series:
+        """
+        Get average fixture difficulty for every team in one pass
+
+        Args:
+            n_games: Number of upcoming fixtures to average over
+
+        Returns:
+            Series of average difficulty indexed by team ID (0 for teams without fixtures)
+        """
+        return self._cached(
+            ('difficulties', n_games), lambda: self._average_difficulties(n_games)
+        ).copy()
+
+    def _average_difficulties(self, n_games: int) -> pd.Series:
+        """Average difficulty of every team's next n_games fixtures"""
+        upcoming = self.team_fixtures_df.groupby('team').head(n_games)
+        avg_difficulty = upcoming.groupby('team')['difficulty'].mean().round(2)
+
+        return avg_difficulty.reindex(self.teams_df['id'], fill_value=0)
+
+    def get_next_team_fixtures(self) -> pd.DataFrame:
+        """
+        Get each team's next fixture
+
+        Returns:
+            DataFrame of opponent, venue and difficulty indexed by team ID
+        """
+        next_fixtures = self._cached(
+            ('next',),
+            lambda: self.team_fixtures_df.groupby('team').head(1).set_index('team')
+        )
+        return next_fixtures[['opponent', 'venue', 'difficulty']].copy()
+
     def get_best_fixtures(self, n_gameweeks: int = 5) -> pd.DataFrame:
         """
         Get teams with best upcoming fixtures
@@ -133,21 +264,24 @@ class FixtureAnalyzer:
         Returns:
             DataFrame of teams sorted by fixture difficulty
         """
-        results = []
-
-        for _, team in self.teams_df.iterrows():
-            analysis = self.get_fixture_difficulty(team['name'], n_gameweeks)
-            results.append({
-                'team': team['short_name'],
-                'team_name': team['name'],
-                'avg_difficulty': analysis['avg_difficulty'],
-                'fixtures': ' '.join([
-                    f"{f['opponent']}({f['venue']})"
-                    for f in analysis['fixtures'][:5]
-                ])
-            })
-
-        df = pd.DataFrame(results)
+        return self._cached(
+            ('best', n_gameweeks), lambda: self._rank_fixtures(n_gameweeks)
+        ).copy()
+
+    def _rank_fixtures(self, n_gameweeks: int) -> pd.DataFrame:
+        """Rank all teams by average difficulty of their next n_gameweeks fixtures"""
+        upcoming = self.team_fixtures_df.groupby('team').head(n_gameweeks)
+        avg_difficulty = self._cached(
+            ('difficulties', n_gameweeks), lambda: self._average_difficulties(n_gameweeks)
+        )
+        fixture_strings = upcoming.groupby('team').head(5).groupby('team')['label'].agg(' '.join)
+
+        df = pd.DataFrame({
+            'team': self.teams_df['short_name'],
+            'team_name': self.teams_df['name'],
+            'avg_difficulty': avg_difficulty.to_numpy(),
+            'fixtures': self.teams_df['id'].map(fixture_strings).fillna('')
+        })
         df = df.sort_values('avg_difficulty')
 
         return df.reset_index(drop=True)
@@ -162,8 +296,7 @@ class FixtureAnalyzer:
         Returns:
             DataFrame of teams with hardest fixtures
         """
-        df = self.get_best_fixtures(n_gameweeks)
-        return df.sort_values('avg_difficulty', ascending=False).reset_index(drop=True)
+        return self.get_best_fixtures(n_gameweeks).iloc[::-1].reset_index(drop=True)
 
     def get_gameweek_fixtures(self, gameweek: int) -> pd.DataFrame:
         """
@@ -185,42 +318,69 @@ class FixtureAnalyzer:
 
         return df[columns].reset_index(drop=True)
 
-    def get_double_gameweeks(self) -> pd.DataFrame:
+    def _team_gameweek_counts(self, df: pd.DataFrame) -> pd.DataFrame:
         """
-        Identify teams with double gameweeks
+        Count fixtures per team in each gameweek
+
+        Args:
+            df: Fixtures DataFrame to count
 
         Returns:
-            DataFrame showing teams with multiple fixtures in a gameweek
+            DataFrame indexed by gameweek with one column per team ID
+        """
+        team_gw = pd.concat([
+            df[['event', 'team_h']].rename(columns={'team_h': 'team'}),
+            df[['event', 'team_a']].rename(columns={'team_a': 'team'})
+        ])
+
+        counts = team_gw.groupby(['event', 'team']).size().unstack(fill_value=0)
+
+        # Include teams without any fixture so blanks are counted as zero
+        counts = counts.reindex(columns=self.teams_df['id'], fill_value=0)
+        counts.index = counts.index.astype(int)
+
+        return counts.rename_axis(index='gameweek', columns='team')
+
+    def _label_team_gameweeks(self, counts: pd.Series) -> pd.DataFrame:
         """
-        df = self.fixtures_df[self.fixtures_df['finished'] == False].copy()
+        Turn a (gameweek, team ID) indexed Series into rows labelled by short name
 
-        # Count fixtures per team per gameweek
-        home_counts = df.groupby(['event', 'team_h']).size().reset_index(name='home_count')
-        away_counts = df.groupby(['event', 'team_a']).size().reset_index(name='away_count')
+        The counts come from stacking a gameweek-sorted table, so rows are
+        already in gameweek order and are collected column-wise in one go.
+        """
+        short_names = self.teams_df.set_index('id')['short_name']
+        team_ids = counts.index.get_level_values('team')
 
-        # Combine counts
-        dgw_data = []
+        return pd.DataFrame({
+            'gameweek': counts.index.get_level_values('gameweek'),
+            'team': short_names.reindex(team_ids).to_numpy(),
+            counts.name: counts.to_numpy()
+        })
 
-        for _, team in self.teams_df.iterrows():
-            team_id = team['id']
+    def _upcoming_gameweek_counts(self) -> pd.Series:
+        """Upcoming fixture count per (gameweek, team), shared by double and blank lookups"""
+        return self._cached(
+            ('gameweek_counts',), lambda: self._team_gameweek_counts(self.upcoming_df).stack()
+        )
 
-            # Check each gameweek
-            for gw in df['event'].unique():
-                home = len(df[(df['event'] == gw) & (df['team_h'] == team_id)])
-                away = len(df[(df['event'] == gw) & (df['team_a'] == team_id)])
-                total = home + away
+    def get_double_gameweeks(self) -> pd.DataFrame:
+        """
+        Identify teams with double gameweeks
 
-                if total > 1:
-                    dgw_data.append({
-                        'gameweek': gw,
-                        'team': team['short_name'],
-                        'fixtures': total
-                    })
+        Returns:
+            DataFrame showing teams with multiple fixtures in a gameweek
+        """
+        return self._cached(('double',), self._find_double_gameweeks).copy()
 
-        if not dgw_data:
+    def _find_double_gameweeks(self) -> pd.DataFrame:
+        """Build the double gameweek table from upcoming fixtures"""
+        counts = self._upcoming_gameweek_counts()
+        counts = counts[counts > 1]
+
+        if counts.empty:
             return pd.DataFrame(columns=['gameweek', 'team', 'fixtures'])
 
-        return pd.DataFrame(dgw_data).sort_values('gameweek')
+        return self._label_team_gameweeks(counts.rename('fixtures'))
 
     def get_blank_gameweeks(self) -> pd.DataFrame:
         """
@@ -229,32 +389,38 @@ class FixtureAnalyzer:
         Returns:
             DataFrame showing teams with no fixtures in a gameweek
         """
-        df = self.fixtures_df[self.fixtures_df['finished'] == False].copy()
+        return self._cached(('blank',), self._find_blank_gameweeks).copy()
 
-        blank_data = []
+    def _find_blank_gameweeks(self) -> pd.DataFrame:
+        """Build the blank gameweek table from upcoming fixtures"""
+        counts = self._upcoming_gameweek_counts()
+        counts = counts[counts == 0]
 
-        for _, team in self.teams_df.iterrows():
-            team_id = team['id']
+        if counts.empty:
+            return pd.DataFrame(columns=['gameweek', 'team'])
 
-            # Get all upcoming gameweeks
-            all_gws = sorted(df['event'].unique())
+        return self._label_team_gameweeks(counts.rename('fixtures')).drop(columns='fixtures')
 
-            for gw in all_gws:
-                has_fixture = len(df[
-                    (df['event'] == gw) &
-                    ((df['team_h'] == team_id) | (df['team_a'] == team_id))
-                ]) > 0
+    def summarize(self, n: int = 5) -> Dict[str, Any]:
+        """
+        Get the fixture tables used for chip planning in one call
 
-                if not has_fixture:
-                    blank_data.append({
-                        'gameweek': gw,
-                        'team': team['short_name']
-                    })
+        Double and blank gameweeks are derived from one shared per-gameweek
+        count table, and the ranking from one per-team difficulty average
 
-        if not blank_data:
-            return pd.DataFrame(columns=['gameweek', 'team'])
+        Args:
+            n: Number of upcoming fixtures per team to average over
 
-        return pd.DataFrame(blank_data).sort_values('gameweek')
+        Returns:
+            Dictionary with 'double_gameweeks', 'blank_gameweeks', 'best_fixtures'
+            and 'avg_difficulty' (Series indexed by team ID)
+        """
+        return {
+            'double_gameweeks': self.get_double_gameweeks(),
+            'blank_gameweeks': self.get_blank_gameweeks(),
+            'best_fixtures': self.get_best_fixtures(n),
+            'avg_difficulty': self.get_all_team_difficulties(n)
+        }
 
     def compare_fixtures(self, team_names: List[str], n: int = 5) -> pd.DataFrame:
         """
@@ -296,36 +462,38 @@ class FixtureAnalyzer:
         if not current_gw:
             current_gw = 1
 
-        ticker_data = []
-
-        for _, team in self.teams_df.iterrows():
-            fixtures = self.get_upcoming_fixtures(team['name'], n_gameweeks)
-
-            row = {'team': team['short_name']}
-
-            for i, (_, fixture) in enumerate(fixtures.iterrows(), 1):
-                if team['id'] == fixture.get('team_h', 0):
-                    opponent = fixture['away_short']
-                    difficulty = fixture['team_h_difficulty']
-                    venue = 'H'
-                else:
-                    opponent = fixture['home_short']
-                    difficulty = fixture['team_a_difficulty']
-                    venue = 'A'
-
-                row[f'GW{current_gw + i - 1}'] = f"{opponent}({venue})[{difficulty}]"
+        upcoming = self.team_fixtures_df.groupby('team').head(n_gameweeks)
+        suffixes = [
+            TICKER_SUFFIX.get(key) or f"({key[0]})[{key[1]}]"
+            for key in zip(upcoming['venue'], upcoming['difficulty'])
+        ]
+        upcoming = upcoming.assign(
+            slot=upcoming.groupby('team').cumcount(),
+            cell=upcoming['opponent'].astype(str) + suffixes
+        )
 
-            ticker_data.append(row)
+        ticker = upcoming.pivot(index='team', columns='slot', values='cell')
+        ticker = ticker.reindex(self.teams_df['id'])
+        ticker.columns = [f'GW{current_gw + slot}' for slot in ticker.columns]
+        ticker.insert(0, 'team', self.teams_df['short_name'].to_numpy())
 
-        return pd.DataFrame(ticker_data)
+        return ticker.reset_index(drop=True)
 
     def refresh_data(self):
-        """Refresh fixture data from API"""
+        """
+        Refresh fixture data from API
+
+        An attached player analyzer is reloaded first, so the team table
+        reused here comes from the same fresh data
+        """
         self.client.clear_cache()
+        if self.player_analyzer is not None:
+            self.player_analyzer._load_data()
         self._load_data()
 
 
-if __name__ == "__main__":
+def _selftest():
+    """Smoke-test the analyzer against the live FPL API"""
     print("Testing Fixture Analyzer...")
     analyzer = FixtureAnalyzer()
 
@@ -343,3 +511,15 @@ if __name__ == "__main__":
         print("   No double gameweeks found")
 
     print("\n✅ Fixture Analyzer tests passed!")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Fixture Analyzer")
+    parser.add_argument('--selftest', action='store_true',
+                        help="run smoke tests against the live FPL API")
+    args = parser.parse_args()
+
+    if args.selftest:
+        _selftest()
+    else:
+        parser.print_help()
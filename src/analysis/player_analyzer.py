@@ -2,10 +2,23 @@
 Player Analyzer
 Analyzes player performance, form, value, and differentials
 """
+import argparse
+from concurrent.futures import ThreadPoolExecutor
 import pandas as pd
 from typing import List, Dict, Optional
 import sys
 from src.api.fpl_client import FPLClient
+from src.analysis import _scoring
+
+
+# Player fields read by the analyzers; the rest of the bootstrap payload is
+# never loaded into players_df
+PLAYER_COLUMNS = [
+    'id', 'web_name', 'first_name', 'second_name', 'team', 'element_type',
+    'now_cost', 'total_points', 'points_per_game', 'form', 'selected_by_percent',
+    'status', 'news', 'minutes', 'goals_scored', 'assists', 'clean_sheets',
+    'bonus', 'cost_change_start'
+]
 
 
 class PlayerAnalyzer:
@@ -27,19 +40,31 @@ class PlayerAnalyzer:
         """Load and prepare player and team data"""
         data = self.client.get_bootstrap_static()
 
-        # Create players DataFrame
-        self.players_df = pd.DataFrame(data['elements'])
+        # Create players DataFrame, indexed by player ID for direct row lookups
+        # (the index is left unnamed so 'id' stays unambiguous as a column)
+        self.players_df = pd.DataFrame(data['elements'], columns=PLAYER_COLUMNS)
+        self.players_df = self.players_df.set_index('id', drop=False).rename_axis(None)
 
         # Create teams DataFrame
         self.teams_df = pd.DataFrame(data['teams'])
 
-        # Add team names to players
-        team_map = dict(zip(self.teams_df['id'], self.teams_df['name']))
-        self.players_df['team_name'] = self.players_df['team'].map(team_map)
+        # Add team names to players as integer codes into the team list
+        # (ids missing from the team list get code -1, i.e. NaN)
+        team_codes = pd.Index(self.teams_df['id']).get_indexer(self.players_df['team'])
+        self.players_df['team_name'] = pd.Categorical.from_codes(
+            team_codes, categories=self.teams_df['name']
+        )
+        self._team_name_to_id = {
+            name.lower(): team_id
+            for team_id, name in zip(self.teams_df['id'], self.teams_df['name'])
+        }
 
-        # Add position names
+        # Add position names the same way
         positions = {1: 'GKP', 2: 'DEF', 3: 'MID', 4: 'FWD'}
-        self.players_df['position'] = self.players_df['element_type'].map(positions)
+        position_codes = pd.Index(list(positions)).get_indexer(self.players_df['element_type'])
+        self.players_df['position'] = pd.Categorical.from_codes(
+            position_codes, categories=list(positions.values())
+        )
 
         # Calculate value metrics
         self.players_df['value'] = self.players_df['now_cost'] / 10.0
@@ -47,6 +72,18 @@ class PlayerAnalyzer:
             self.players_df['total_points'] / self.players_df['value']
         ).round(2)
 
+        # Status holds a handful of codes; store it as integer codes rather than
+        # Python strings so comparisons and mapping work on the small category set
+        self.players_df['status'] = self.players_df['status'].astype('category')
+
+        # Availability is the most common filter; evaluate it once
+        self.players_df['is_available'] = self.players_df['status'] == 'a'
+
+        # The API sends these as strings; parse them once at ingest so every
+        # filter, sort and score works on float columns
+        for col in ('form', 'selected_by_percent', 'points_per_game'):
+            self.players_df[col] = pd.to_numeric(self.players_df[col], errors='coerce')
+
     def get_top_form_players(self, n: int = 10, position: Optional[str] = None) -> pd.DataFrame:
         """
         Get players with best recent form
@@ -58,18 +95,17 @@ class PlayerAnalyzer:
         Returns:
             DataFrame of top form players
         """
-        df = self.players_df.copy()
+        df = self.players_df
 
         # Filter by position if specified
         if position:
             df = df[df['position'] == position.upper()]
 
         # Filter available players
-        df = df[df['status'] == 'a']
+        df = df[df['is_available']]
 
-        # Sort by form (string, convert to float)
-        df['form_float'] = df['form'].astype(float)
-        df = df.sort_values('form_float', ascending=False)
+        # Partial sort: only the top n rows are needed
+        df = df.nlargest(n, 'form')
 
         # Select relevant columns
         columns = [
@@ -78,7 +114,7 @@ class PlayerAnalyzer:
             'selected_by_percent', 'points_per_million'
         ]
 
-        return df[columns].head(n).reset_index(drop=True)
+        return df[columns].reset_index(drop=True)
 
     def get_best_value_players(self, n: int = 10, position: Optional[str] = None,
                                 max_price: Optional[float] = None) -> pd.DataFrame:
@@ -93,7 +129,7 @@ class PlayerAnalyzer:
         Returns:
             DataFrame of best value players
         """
-        df = self.players_df.copy()
+        df = self.players_df
 
         # Filter by position
         if position:
@@ -104,10 +140,10 @@ class PlayerAnalyzer:
             df = df[df['value'] <= max_price]
 
         # Filter available players with points
-        df = df[(df['status'] == 'a') & (df['total_points'] > 0)]
+        df = df[df['is_available'] & (df['total_points'] > 0)]
 
-        # Sort by points per million
-        df = df.sort_values('points_per_million', ascending=False)
+        # Partial sort by points per million
+        df = df.nlargest(n, 'points_per_million')
 
         columns = [
             'web_name', 'team_name', 'position', 'value',
@@ -115,7 +151,7 @@ class PlayerAnalyzer:
             'selected_by_percent'
         ]
 
-        return df[columns].head(n).reset_index(drop=True)
+        return df[columns].reset_index(drop=True)
 
     def get_differential_picks(self, n: int = 10, max_ownership: float = 5.0,
                                min_points: int = 20) -> pd.DataFrame:
@@ -130,21 +166,7 @@ class PlayerAnalyzer:
         Returns:
             DataFrame of differential players
         """
-        df = self.players_df.copy()
-
-        # Filter criteria
-        df = df[
-            (df['status'] == 'a') &
-            (df['selected_by_percent'].astype(float) <= max_ownership) &
-            (df['total_points'] >= min_points)
-        ]
-
-        # Calculate differential score (points per million * form)
-        df['diff_score'] = (
-            df['points_per_million'] * df['form'].astype(float)
-        ).round(2)
-
-        df = df.sort_values('diff_score', ascending=False)
+        df = self.players_df
 
         columns = [
             'web_name', 'team_name', 'position', 'value',
@@ -152,7 +174,25 @@ class PlayerAnalyzer:
             'diff_score', 'points_per_million'
         ]
 
-        return df[columns].head(n).reset_index(drop=True)
+        # Filter criteria, keeping only the columns needed downstream
+        mask = (
+            df['is_available'] &
+            (df['selected_by_percent'] <= max_ownership) &
+            (df['total_points'] >= min_points)
+        )
+        df = df.loc[mask, [
+            'web_name', 'team_name', 'position', 'value', 'total_points',
+            'form', 'selected_by_percent', 'points_per_million'
+        ]]
+
+        # Calculate differential score (points per million * form)
+        df = df.assign(diff_score=_scoring.diff_score(
+            df['points_per_million'].to_numpy(), df['form'].to_numpy()
+        ))
+
+        df = df.nlargest(n, 'diff_score')
+
+        return df[columns].reset_index(drop=True)
 
     def compare_players(self, player_ids: List[int]) -> pd.DataFrame:
         """
@@ -164,8 +204,6 @@ class PlayerAnalyzer:
         Returns:
             DataFrame with player comparison
         """
-        df = self.players_df[self.players_df['id'].isin(player_ids)].copy()
-
         columns = [
             'web_name', 'team_name', 'position', 'value',
             'total_points', 'points_per_game', 'form',
@@ -174,7 +212,26 @@ class PlayerAnalyzer:
             'clean_sheets', 'bonus'
         ]
 
-        return df[columns].reset_index(drop=True)
+        # Look the players up by ID in the order given, skipping unknown and repeated IDs
+        ids = [pid for pid in dict.fromkeys(player_ids) if pid in self.players_df.index]
+
+        return self.players_df.loc[ids, columns].reset_index(drop=True)
+
+    def _resolve_team_ids(self, team_name: str) -> List[int]:
+        """
+        Resolve a team name to matching team IDs
+
+        Args:
+            team_name: Full team name (falls back to partial match)
+
+        Returns:
+            List of matching team IDs (empty if no team matches)
+        """
+        key = team_name.lower()
+        if key in self._team_name_to_id:
+            return [self._team_name_to_id[key]]
+
+        return [team_id for name, team_id in self._team_name_to_id.items() if key in name]
 
     def get_players_by_team(self, team_name: str) -> pd.DataFrame:
         """
@@ -186,9 +243,8 @@ class PlayerAnalyzer:
         Returns:
             DataFrame of team's players
         """
-        df = self.players_df[
-            self.players_df['team_name'].str.contains(team_name, case=False)
-        ].copy()
+        team_ids = self._resolve_team_ids(team_name)
+        df = self.players_df[self.players_df['team'].isin(team_ids)]
 
         df = df.sort_values('total_points', ascending=False)
 
@@ -206,24 +262,23 @@ class PlayerAnalyzer:
         Returns:
             Dictionary with 'risers' and 'fallers' DataFrames
         """
-        df = self.players_df.copy()
-
-        # Players who rose in price
-        risers = df[df['cost_change_start'] > 0].copy()
-        risers = risers.sort_values('cost_change_start', ascending=False)
-
-        # Players who fell in price
-        fallers = df[df['cost_change_start'] < 0].copy()
-        fallers = fallers.sort_values('cost_change_start')
-
         columns = [
             'web_name', 'team_name', 'position', 'value',
             'cost_change_start', 'total_points', 'form'
         ]
 
+        df = self.players_df[columns]
+        change = df['cost_change_start']
+
+        # Players who rose in price
+        risers = df[change > 0].nlargest(10, 'cost_change_start')
+
+        # Players who fell in price
+        fallers = df[change < 0].nsmallest(10, 'cost_change_start')
+
         return {
-            'risers': risers[columns].head(10).reset_index(drop=True),
-            'fallers': fallers[columns].head(10).reset_index(drop=True)
+            'risers': risers.reset_index(drop=True),
+            'fallers': fallers.reset_index(drop=True)
         }
 
     def get_injury_list(self) -> pd.DataFrame:
@@ -233,23 +288,27 @@ class PlayerAnalyzer:
         Returns:
             DataFrame of unavailable players
         """
-        df = self.players_df[self.players_df['status'] != 'a'].copy()
-
         status_map = {
             'i': 'Injured',
             'd': 'Doubtful',
             's': 'Suspended',
             'u': 'Unavailable'
         }
-        df['status_text'] = df['status'].map(status_map)
-
-        df = df.sort_values('selected_by_percent', ascending=False)
 
         columns = [
             'web_name', 'team_name', 'position', 'value',
             'status_text', 'news', 'selected_by_percent'
         ]
 
+        df = self.players_df.loc[
+            ~self.players_df['is_available'],
+            ['web_name', 'team_name', 'position', 'value', 'status',
+             'news', 'selected_by_percent']
+        ]
+        df = df.assign(status_text=df['status'].map(status_map))
+
+        df = df.sort_values('selected_by_percent', ascending=False)
+
         return df[columns].reset_index(drop=True)
 
     def get_player_details(self, player_id: int) -> Dict:
@@ -262,27 +321,33 @@ class PlayerAnalyzer:
         Returns:
             Dictionary with player details
         """
-        player = self.players_df[self.players_df['id'] == player_id].iloc[0]
-
-        details = {
-            'name': f"{player['first_name']} {player['second_name']}",
-            'web_name': player['web_name'],
-            'team': player['team_name'],
-            'position': player['position'],
-            'price': player['value'],
-            'total_points': int(player['total_points']),
-            'form': float(player['form']),
-            'points_per_game': float(player['points_per_game']),
-            'ownership': float(player['selected_by_percent']),
-            'points_per_million': player['points_per_million'],
-            'minutes': int(player['minutes']),
-            'goals': int(player['goals_scored']),
-            'assists': int(player['assists']),
-            'clean_sheets': int(player['clean_sheets']),
-            'bonus': int(player['bonus']),
-            'status': player['status']
+        # Source column -> details key; columns are already typed at load time
+        fields = {
+            'web_name': 'web_name',
+            'team_name': 'team',
+            'position': 'position',
+            'value': 'price',
+            'total_points': 'total_points',
+            'form': 'form',
+            'points_per_game': 'points_per_game',
+            'selected_by_percent': 'ownership',
+            'points_per_million': 'points_per_million',
+            'minutes': 'minutes',
+            'goals_scored': 'goals',
+            'assists': 'assists',
+            'clean_sheets': 'clean_sheets',
+            'bonus': 'bonus',
+            'status': 'status'
         }
 
+        player = self.players_df.loc[
+            [player_id], ['first_name', 'second_name', *fields]
+        ].rename(columns=fields).to_dict('records')[0]
+
+        # Records are boxed to native Python scalars in a single pass
+        details = {'name': f"{player.pop('first_name')} {player.pop('second_name')}"}
+        details.update(player)
+
         # Get additional history if available
         try:
             summary = self.client.get_player_summary(player_id)
@@ -299,17 +364,36 @@ class PlayerAnalyzer:
         self._load_data()
 
 
-if __name__ == "__main__":
+def _selftest():
+    """Smoke-test the analyzer against the live FPL API"""
     print("Testing Player Analyzer...")
     analyzer = PlayerAnalyzer()
 
-    print("\n1. Top 5 Form Players:")
-    print(analyzer.get_top_form_players(5))
+    # Queries only read the loaded frame, so run them together and print in order
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        top_form = executor.submit(analyzer.get_top_form_players, 5)
+        best_value = executor.submit(analyzer.get_best_value_players, 5, max_price=7.0)
+        differentials = executor.submit(analyzer.get_differential_picks, 5)
+
+        print("\n1. Top 5 Form Players:")
+        print(top_form.result())
 
-    print("\n2. Best Value Players (under £7m):")
-    print(analyzer.get_best_value_players(5, max_price=7.0))
+        print("\n2. Best Value Players (under £7m):")
+        print(best_value.result())
 
-    print("\n3. Differential Picks:")
-    print(analyzer.get_differential_picks(5))
+        print("\n3. Differential Picks:")
+        print(differentials.result())
 
     print("\n✅ Player Analyzer tests passed!")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Player Analyzer")
+    parser.add_argument('--selftest', action='store_true',
+                        help="run smoke tests against the live FPL API")
+    args = parser.parse_args()
+
+    if args.selftest:
+        _selftest()
+    else:
+        parser.print_help()
@@ -2,28 +2,95 @@
 Transfer Advisor
 Provides transfer recommendations based on fixtures, form, and value
 """
+import argparse
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
 import pandas as pd
-from typing import List, Dict, Optional, Tuple
-import sys
-sys.path.append('/data/data/com.termux/files/home/fpl_project')
+from typing import List, Dict, Optional
 from src.api.fpl_client import FPLClient
 from src.analysis.player_analyzer import PlayerAnalyzer
 from src.analysis.fixture_analyzer import FixtureAnalyzer
+from src.analysis import _scoring
+
+
+# Analyzers shared by every TransferAdvisor built on the same client, so player
+# and team data are loaded once per client. Keyed by id(client): analyzers hold
+# their client, so a live entry's id cannot be reused. Entries are dropped once
+# no advisor references the analyzers any more
+_SHARED_PLAYER_ANALYZERS = weakref.WeakValueDictionary()
+_SHARED_FIXTURE_ANALYZERS = weakref.WeakValueDictionary()
+
+
+def _shared_player_analyzer(client: FPLClient) -> PlayerAnalyzer:
+    """
+    Get the player analyzer shared for a client, creating it on first use
+
+    Args:
+        client: FPLClient instance
+
+    Returns:
+        Shared PlayerAnalyzer
+    """
+    player_analyzer = _SHARED_PLAYER_ANALYZERS.get(id(client))
+    if player_analyzer is None:
+        player_analyzer = PlayerAnalyzer(client)
+        _SHARED_PLAYER_ANALYZERS[id(client)] = player_analyzer
+    return player_analyzer
+
+
+def _shared_fixture_analyzer(client: FPLClient, player_analyzer: PlayerAnalyzer) -> FixtureAnalyzer:
+    """
+    Get a fixture analyzer attached to the given player analyzer
+
+    The analyzer shared for the client is reused when it is attached to the
+    same player analyzer; otherwise a new one is built on player_analyzer's
+    team data (and only shared if player_analyzer is the shared one).
+
+    Args:
+        client: FPLClient instance
+        player_analyzer: PlayerAnalyzer whose team data the analyzer reuses
+
+    Returns:
+        FixtureAnalyzer attached to player_analyzer
+    """
+    fixture_analyzer = _SHARED_FIXTURE_ANALYZERS.get(id(client))
+    if fixture_analyzer is not None and fixture_analyzer.player_analyzer is player_analyzer:
+        return fixture_analyzer
+
+    fixture_analyzer = FixtureAnalyzer(client, player_analyzer)
+    if player_analyzer is _SHARED_PLAYER_ANALYZERS.get(id(client)):
+        _SHARED_FIXTURE_ANALYZERS[id(client)] = fixture_analyzer
+    return fixture_analyzer
 
 
 class TransferAdvisor:
     """Provides intelligent transfer recommendations"""
 
-    def __init__(self, client: Optional[FPLClient] = None):
+    def __init__(self, client: Optional[FPLClient] = None,
+                 player_analyzer: Optional[PlayerAnalyzer] = None,
+                 fixture_analyzer: Optional[FixtureAnalyzer] = None):
         """
         Initialize transfer advisor
 
         Args:
             client: FPLClient instance
+            player_analyzer: Existing PlayerAnalyzer to reuse (the fixture analyzer's,
+                or shared per client, if not provided)
+            fixture_analyzer: Existing FixtureAnalyzer to reuse (attached to
+                player_analyzer and shared per client if not provided)
         """
         self.client = client if client else FPLClient()
-        self.player_analyzer = PlayerAnalyzer(self.client)
-        self.fixture_analyzer = FixtureAnalyzer(self.client)
+        # Build only the analyzers that weren't passed in
+        if player_analyzer is None:
+            if fixture_analyzer is not None and fixture_analyzer.player_analyzer is not None:
+                player_analyzer = fixture_analyzer.player_analyzer
+            else:
+                player_analyzer = _shared_player_analyzer(self.client)
+        if fixture_analyzer is None:
+            fixture_analyzer = _shared_fixture_analyzer(self.client, player_analyzer)
+        self.player_analyzer = player_analyzer
+        self.fixture_analyzer = fixture_analyzer
 
     def get_transfer_targets(self, position: Optional[str] = None,
                             max_price: Optional[float] = None,
@@ -39,8 +106,13 @@ class TransferAdvisor:
         Returns:
             DataFrame of recommended transfer targets
         """
+        return self._get_transfer_targets_raw(position, max_price, n).reset_index(drop=True)
+
+    def _get_transfer_targets_raw(self, position: Optional[str], max_price: Optional[float],
+                                  n: int) -> pd.DataFrame:
+        """Ranked transfer targets, still indexed by player ID, for internal callers"""
         # Get players data
-        df = self.player_analyzer.players_df.copy()
+        df = self.player_analyzer.players_df
 
         # Apply filters
         if position:
@@ -49,43 +121,37 @@ class TransferAdvisor:
         if max_price:
             df = df[df['value'] <= max_price]
 
+        columns = [
+            'web_name', 'team_name', 'position', 'value',
+            'form', 'points_per_million', 'selected_by_percent',
+            'transfer_score', 'total_points'
+        ]
+
         # Filter available players with decent points
-        df = df[(df['status'] == 'a') & (df['total_points'] > 20)]
+        df = df.loc[df['is_available'] & (df['total_points'] > 20), [
+            'web_name', 'team', 'team_name', 'position', 'value', 'form',
+            'points_per_million', 'selected_by_percent', 'total_points'
+        ]]
 
         # Calculate transfer score
         # Factors: form, points per million, upcoming fixtures
-        df['form_float'] = df['form'].astype(float)
-        df['ownership_float'] = df['selected_by_percent'].astype(float)
-
-        # Get fixture difficulty for each team
-        fixture_scores = {}
-        for team_id in df['team'].unique():
-            team = self.player_analyzer.teams_df[
-                self.player_analyzer.teams_df['id'] == team_id
-            ].iloc[0]
-            fixture_data = self.fixture_analyzer.get_fixture_difficulty(team['name'], 5)
-            # Lower difficulty is better, so invert (5 - avg_difficulty)
-            fixture_scores[team_id] = 5 - fixture_data['avg_difficulty']
-
-        df['fixture_score'] = df['team'].map(fixture_scores)
+        # Lower difficulty is better, so invert (5 - avg_difficulty)
+        fixture_scores = 5 - self.fixture_analyzer.get_all_team_difficulties(5)
 
         # Calculate overall transfer score
         # Form (40%) + Value (30%) + Fixtures (30%)
-        df['transfer_score'] = (
-            (df['form_float'] * 4) +
-            (df['points_per_million'] * 0.3) +
-            (df['fixture_score'] * 3)
-        ).round(2)
+        df = df.assign(
+            fixture_score=df['team'].map(fixture_scores),
+            transfer_score=lambda x: _scoring.transfer_score(
+                x['form'].to_numpy(),
+                x['points_per_million'].to_numpy(),
+                x['fixture_score'].to_numpy()
+            )
+        )
 
-        df = df.sort_values('transfer_score', ascending=False)
+        df = df.nlargest(n, 'transfer_score')
 
-        columns = [
-            'web_name', 'team_name', 'position', 'value',
-            'form', 'points_per_million', 'selected_by_percent',
-            'transfer_score', 'total_points'
-        ]
-
-        return df[columns].head(n).reset_index(drop=True)
+        return df[columns]
 
     def get_transfer_out_candidates(self, n: int = 10) -> pd.DataFrame:
         """
@@ -97,37 +163,7 @@ class TransferAdvisor:
         Returns:
             DataFrame of players to consider selling
         """
-        df = self.player_analyzer.players_df.copy()
-
-        # Filter players with high ownership (likely in many teams)
-        df = df[df['selected_by_percent'].astype(float) > 10]
-
-        df['form_float'] = df['form'].astype(float)
-
-        # Get fixture difficulty
-        fixture_scores = {}
-        for team_id in df['team'].unique():
-            team = self.player_analyzer.teams_df[
-                self.player_analyzer.teams_df['id'] == team_id
-            ].iloc[0]
-            fixture_data = self.fixture_analyzer.get_fixture_difficulty(team['name'], 5)
-            # High difficulty = bad fixtures
-            fixture_scores[team_id] = fixture_data['avg_difficulty']
-
-        df['fixture_difficulty'] = df['team'].map(fixture_scores)
-
-        # Calculate sell score (high = should sell)
-        # Bad form + high price + tough fixtures + injured
-        df['sell_score'] = (
-            (5 - df['form_float']) * 2 +  # Poor form
-            (df['fixture_difficulty'] * 2) +  # Tough fixtures
-            (df['value'] * 0.5)  # Expensive
-        ).round(2)
-
-        # Boost score for injured/unavailable
-        df.loc[df['status'] != 'a', 'sell_score'] *= 1.5
-
-        df = df.sort_values('sell_score', ascending=False)
+        df = self.player_analyzer.players_df
 
         columns = [
             'web_name', 'team_name', 'position', 'value',
@@ -135,7 +171,29 @@ class TransferAdvisor:
             'fixture_difficulty', 'sell_score'
         ]
 
-        return df[columns].head(n).reset_index(drop=True)
+        # Filter players with high ownership (likely in many teams)
+        df = df.loc[df['selected_by_percent'] > 10, [
+            'web_name', 'team', 'team_name', 'position', 'value', 'form',
+            'status', 'is_available', 'selected_by_percent'
+        ]]
+
+        # High difficulty = bad fixtures
+        df = df.assign(
+            fixture_difficulty=df['team'].map(self.fixture_analyzer.get_all_team_difficulties(5))
+        )
+
+        # Calculate sell score (high = should sell)
+        # Bad form + high price + tough fixtures, boosted for injured/unavailable
+        df = df.assign(sell_score=_scoring.sell_score(
+            df['form'].to_numpy(),
+            df['fixture_difficulty'].to_numpy(),
+            df['value'].to_numpy(),
+            df['is_available'].to_numpy()
+        ))
+
+        df = df.nlargest(n, 'sell_score')
+
+        return df[columns].reset_index(drop=True)
 
     def suggest_transfers(self, player_out_id: int, budget: float,
                          same_position: bool = True) -> pd.DataFrame:
@@ -155,19 +213,19 @@ class TransferAdvisor:
         position = player_out['position'] if same_position else None
 
         # Get transfer targets within budget
-        targets = self.get_transfer_targets(
+        targets = self._get_transfer_targets_raw(
             position=position,
             max_price=budget,
-            n=15
+            n=10
         )
 
         # Add comparison columns
-        targets['price_diff'] = (targets['value'] - player_out['price']).round(1)
-        targets['form_diff'] = (
-            targets['form'].astype(float) - player_out['form']
-        ).round(2)
+        targets = targets.assign(
+            price_diff=(targets['value'] - player_out['price']).round(1),
+            form_diff=(targets['form'] - player_out['form']).round(2)
+        )
 
-        return targets.head(10)
+        return targets.reset_index(drop=True)
 
     def get_captaincy_picks(self, n: int = 5) -> pd.DataFrame:
         """
@@ -179,65 +237,37 @@ class TransferAdvisor:
         Returns:
             DataFrame of captain recommendations
         """
-        df = self.player_analyzer.players_df.copy()
+        df = self.player_analyzer.players_df
 
-        # Filter available players with good ownership (template players)
-        df = df[
-            (df['status'] == 'a') &
-            (df['selected_by_percent'].astype(float) > 15)
+        columns = [
+            'web_name', 'team_name', 'position',
+            'opponent', 'form', 'points_per_game',
+            'captain_score', 'selected_by_percent'
         ]
 
-        df['form_float'] = df['form'].astype(float)
-
-        # Get next gameweek fixture difficulty
-        fixture_scores = {}
-        for team_id in df['team'].unique():
-            team = self.player_analyzer.teams_df[
-                self.player_analyzer.teams_df['id'] == team_id
-            ].iloc[0]
-            fixtures = self.fixture_analyzer.get_upcoming_fixtures(team['name'], 1)
-
-            if not fixtures.empty:
-                fixture = fixtures.iloc[0]
-                # Get difficulty for this team
-                if team_id == fixture.get('team_h', 0):
-                    difficulty = fixture['team_h_difficulty']
-                    opponent = fixture['away_short']
-                else:
-                    difficulty = fixture['team_a_difficulty']
-                    opponent = fixture['home_short']
-
-                fixture_scores[team_id] = {
-                    'difficulty': difficulty,
-                    'opponent': opponent,
-                    'score': 5 - difficulty
-                }
-            else:
-                fixture_scores[team_id] = {
-                    'difficulty': 3,
-                    'opponent': 'TBD',
-                    'score': 2
-                }
+        # Filter available players with good ownership (template players)
+        df = df.loc[df['is_available'] & (df['selected_by_percent'] > 15), [
+            'web_name', 'team', 'team_name', 'position', 'form',
+            'points_per_game', 'selected_by_percent'
+        ]]
 
-        df['fixture_score'] = df['team'].map(lambda x: fixture_scores.get(x, {}).get('score', 2))
-        df['opponent'] = df['team'].map(lambda x: fixture_scores.get(x, {}).get('opponent', 'TBD'))
+        # Get next gameweek fixture difficulty (teams without one count as neutral)
+        next_fixtures = self.fixture_analyzer.get_next_team_fixtures()
 
         # Captain score: Form (50%) + Fixtures (40%) + Points per game (10%)
-        df['captain_score'] = (
-            (df['form_float'] * 5) +
-            (df['fixture_score'] * 4) +
-            (df['points_per_game'].astype(float))
-        ).round(2)
-
-        df = df.sort_values('captain_score', ascending=False)
+        df = df.assign(
+            fixture_score=(5 - df['team'].map(next_fixtures['difficulty'])).fillna(2),
+            opponent=df['team'].map(next_fixtures['opponent']).astype(object).fillna('TBD'),
+            captain_score=lambda x: _scoring.captain_score(
+                x['form'].to_numpy(),
+                x['fixture_score'].to_numpy(),
+                x['points_per_game'].to_numpy()
+            )
+        )
 
-        columns = [
-            'web_name', 'team_name', 'position',
-            'opponent', 'form', 'points_per_game',
-            'captain_score', 'selected_by_percent'
-        ]
+        df = df.nlargest(n, 'captain_score')
 
-        return df[columns].head(n).reset_index(drop=True)
+        return df[columns].reset_index(drop=True)
 
     def analyze_chip_strategy(self) -> Dict:
         """
@@ -248,18 +278,16 @@ class TransferAdvisor:
         """
         current_gw = self.client.get_current_gameweek()
 
-        # Check for double gameweeks (good for BB, TC)
-        dgw = self.fixture_analyzer.get_double_gameweeks()
-
-        # Check for blank gameweeks (good for Free Hit)
-        bgw = self.fixture_analyzer.get_blank_gameweeks()
-
-        # Get fixture difficulty spread
-        fixtures = self.fixture_analyzer.get_best_fixtures(5)
+        # Double gameweeks (good for BB, TC), blank gameweeks (good for Free Hit)
+        # and the fixture difficulty spread, from one fixture summary
+        summary = self.fixture_analyzer.summarize(5)
+        dgw = summary['double_gameweeks']
+        bgw = summary['blank_gameweeks']
+        fixtures = summary['best_fixtures']
 
         recommendations = {
             'current_gameweek': current_gw,
-            'wildcard_recommendation': self._assess_wildcard(),
+            'wildcard_recommendation': self._assess_wildcard(fixtures),
             'bench_boost_gameweeks': list(dgw['gameweek'].unique()) if not dgw.empty else [],
             'triple_captain_gameweeks': list(dgw['gameweek'].unique()) if not dgw.empty else [],
             'free_hit_gameweeks': list(bgw['gameweek'].unique()) if not bgw.empty else [],
@@ -268,10 +296,11 @@ class TransferAdvisor:
 
         return recommendations
 
-    def _assess_wildcard(self) -> str:
-        """Assess if now is a good time for wildcard"""
+    def _assess_wildcard(self, fixture_df: Optional[pd.DataFrame] = None) -> str:
+        """Assess if now is a good time for wildcard, given the 5-gameweek fixture ranking"""
         # Simple heuristic: Check if many template players have bad fixtures
-        fixture_df = self.fixture_analyzer.get_best_fixtures(5)
+        if fixture_df is None:
+            fixture_df = self.fixture_analyzer.get_best_fixtures(5)
 
         avg_difficulty = fixture_df['avg_difficulty'].mean()
 
@@ -312,16 +341,19 @@ class TransferAdvisor:
         Returns:
             DataFrame of premium options
         """
-        df = self.player_analyzer.players_df.copy()
+        df = self.player_analyzer.players_df
 
         df = df[
             (df['position'] == position.upper()) &
             (df['value'] >= min_price) &
-            (df['status'] == 'a')
+            df['is_available']
         ]
 
-        df['form_float'] = df['form'].astype(float)
-        df = df.sort_values(['form_float', 'total_points'], ascending=False)
+        # Order by form, then total points, descending (last key is primary)
+        order = np.lexsort((
+            -df['total_points'].to_numpy(),
+            -df['form'].to_numpy()
+        ))[:n]
 
         columns = [
             'web_name', 'team_name', 'value',
@@ -329,28 +361,50 @@ class TransferAdvisor:
             'selected_by_percent'
         ]
 
-        return df[columns].head(n).reset_index(drop=True)
+        return df[columns].iloc[order].reset_index(drop=True)
 
     def refresh_data(self):
         """Refresh all data"""
+        # Clear the cache once and reload each analyzer from the fresh data;
+        # the analyzers' own refresh_data would each clear it again. Players
+        # load first, since the fixture analyzer reuses their team table
         self.client.clear_cache()
-        self.player_analyzer.refresh_data()
-        self.fixture_analyzer.refresh_data()
+        self.player_analyzer._load_data()
+        self.fixture_analyzer._load_data()
 
 
-if __name__ == "__main__":
+def _selftest():
+    """Smoke-test the advisor against the live FPL API"""
     print("Testing Transfer Advisor...")
     advisor = TransferAdvisor()
 
-    print("\n1. Top Transfer Targets:")
-    print(advisor.get_transfer_targets(n=5))
+    # Queries only read the loaded analyzers, so run them together and print in order
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        targets = executor.submit(advisor.get_transfer_targets, n=5)
+        captains = executor.submit(advisor.get_captaincy_picks, 5)
+        chip_strategy = executor.submit(advisor.analyze_chip_strategy)
 
-    print("\n2. Captain Picks for Next GW:")
-    print(advisor.get_captaincy_picks(5))
+        print("\n1. Top Transfer Targets:")
+        print(targets.result())
 
-    print("\n3. Chip Strategy:")
-    chips = advisor.analyze_chip_strategy()
+        print("\n2. Captain Picks for Next GW:")
+        print(captains.result())
+
+        print("\n3. Chip Strategy:")
+        chips = chip_strategy.result()
     print(f"   Current GW: {chips['current_gameweek']}")
     print(f"   Wildcard: {chips['wildcard_recommendation']}")
 
     print("\n✅ Transfer Advisor tests passed!")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Transfer Advisor")
+    parser.add_argument('--selftest', action='store_true',
+                        help="run smoke tests against the live FPL API")
+    args = parser.parse_args()
+
+    if args.selftest:
+        _selftest()
+    else:
+        parser.print_help()
@@ -2,55 +2,469 @@
 FPL API Client
 Handles all communication with Fantasy Premier League API
 """
+import argparse
+import asyncio
+import heapq
+import os
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
 import json
-from typing import Dict, List, Optional, Any
+import tempfile
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from types import MappingProxyType
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Any
 from datetime import datetime
 import time
 
+try:
+    import orjson
+except ImportError:  # optional; the stdlib json module is used instead
+    orjson = None
+
+
+def _json_loads(raw: bytes) -> Any:
+    """Decode a JSON document, with orjson when it is installed"""
+    return orjson.loads(raw) if orjson else json.loads(raw)
+
+
+def _json_dumps(data: Any) -> bytes:
+    """Encode a JSON document as UTF-8, with orjson when it is installed"""
+    # Frozen payloads hold read-only mappings, which are written as plain objects
+    if orjson:
+        return orjson.dumps(data, default=dict)
+    return json.dumps(data, default=dict).encode('utf-8')
+
+
+def _freeze(data: Any) -> Any:
+    """
+    Wrap a decoded payload in read-only containers
+
+    Objects become MappingProxyType views and arrays become tuples, for the
+    payload itself and its top-level values (e.g. bootstrap-static's
+    'elements'). Items inside those arrays are shared as-is and must be
+    treated as read-only too.
+
+    Args:
+        data: Decoded JSON payload
+
+    Returns:
+        Read-only payload (already frozen payloads are returned unchanged)
+    """
+    if isinstance(data, dict):
+        return MappingProxyType({
+            key: tuple(value) if isinstance(value, list) else value
+            for key, value in data.items()
+        })
+    if isinstance(data, list):
+        return tuple(data)
+    return data
+
+
+class TokenBucket:
+    """Thread-safe token bucket: allows bursts, throttles the sustained rate"""
+
+    def __init__(self, capacity: float = 10, refill_rate: float = 2):
+        """
+        Initialize bucket (starts full)
+
+        Args:
+            capacity: Maximum burst size in requests
+            refill_rate: Steady-state requests per second
+        """
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._cond = threading.Condition()
+
+    def _refill(self):
+        """Add the tokens earned since the last update"""
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.refill_rate)
+        self._updated = now
+
+    def acquire(self):
+        """Take one token, blocking until one is available"""
+        with self._cond:
+            self._refill()
+            while self._tokens < 1:
+                self._cond.wait((1 - self._tokens) / self.refill_rate)
+                self._refill()
+            self._tokens -= 1
+
 
 class FPLClient:
     """Client for interacting with the FPL API"""
 
     BASE_URL = "https://fantasy.premierleague.com/api"
 
-    def __init__(self, cache_duration: int = 300):
+    # Large, slow-changing endpoints that are also cached on disk between runs
+    PERSISTENT_ENDPOINTS = ("/bootstrap-static/", "/fixtures/")
+    DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "fpl")
+
+    # Failed requests (HTTP error statuses) are remembered this long in seconds,
+    # so repeated lookups of a missing resource don't go back to the network
+    ERROR_CACHE_DURATION = 30
+
+    # Expired entries stay in memory this much longer in seconds, so they can
+    # still be revalidated with a conditional request before being evicted
+    STALE_RETENTION = 600
+
+    # One keep-alive session for every client in the process, so analyzers that
+    # build their own client reuse already-open TLS connections to the API host
+    _shared_session: Optional[requests.Session] = None
+    _session_lock = threading.Lock()
+
+    # Response cache shared by every client created with share_cache=True, so
+    # analyzers that build their own client reuse each other's responses
+    _shared_cache: Dict[str, tuple] = {}
+    _shared_errors: Dict[str, tuple] = {}
+    _shared_validators: Dict[str, Dict[str, str]] = {}
+    _shared_inflight: Dict[str, Future] = {}
+    _shared_derived: Dict[str, tuple] = {}
+    _shared_expiry_heap: List[tuple] = []
+    _shared_disk_mtimes: Dict[str, int] = {}
+    _shared_cache_lock = threading.Lock()
+    _shared_inflight_lock = threading.Lock()
+    # Rate limit shared by the same clients: they reach the API through one
+    # session, so together they get one client's request budget
+    _shared_bucket = TokenBucket(capacity=10, refill_rate=2)
+
+    def __init__(self, cache_duration: int = 300, cache_dir: Optional[str] = DEFAULT_CACHE_DIR,
+                 share_cache: bool = True, prefetch: bool = False):
         """
         Initialize FPL Client
 
         Args:
             cache_duration: How long to cache responses in seconds (default: 5 min)
+            cache_dir: Directory for the on-disk cache of persistent endpoints
+                (None disables it)
+            share_cache: Use the process-wide response cache and rate limit
+                shared with other clients (False gives this client a private
+                cache and its own rate limit)
+            prefetch: Start fetching bootstrap-static and fixtures in the
+                background right away (see prefetch())
         """
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'FPL-Analysis-Tool/1.0'
-        })
-        self.cache = {}
+        self.session = self._get_shared_session()
+        if share_cache:
+            self.cache = FPLClient._shared_cache
+            self._errors = FPLClient._shared_errors
+            self._validators = FPLClient._shared_validators
+            # Indexes and other values derived from the shared payloads are
+            # built once per process
+            self._derived = FPLClient._shared_derived
+            self._expiry_heap = FPLClient._shared_expiry_heap
+            self._disk_mtimes = FPLClient._shared_disk_mtimes
+            self._cache_lock = FPLClient._shared_cache_lock
+        else:
+            self.cache = {}
+            self._errors = {}
+            # Conditional request headers (If-None-Match / If-Modified-Since) for
+            # each cached endpoint, built from the validators its response carried
+            self._validators = {}
+            self._derived = {}
+            # (evict_at, key, stored_at) for every cached entry, soonest first
+            self._expiry_heap = []
+            # Payload file path -> mtime of the version loaded into memory
+            self._disk_mtimes = {}
+            self._cache_lock = threading.Lock()
         self.cache_duration = cache_duration
-        self.last_request_time = 0
-        self.min_request_interval = 1  # Minimum 1 second between requests
+        self.cache_dir = cache_dir
+        # Bursts of up to 10 requests, then 2 per second sustained
+        if share_cache:
+            self._bucket = FPLClient._shared_bucket
+        else:
+            self._bucket = TokenBucket(capacity=10, refill_rate=2)
+        # Requests currently on the wire, so concurrent callers for the same
+        # endpoint wait for one response instead of each sending their own
+        if share_cache:
+            self._inflight = FPLClient._shared_inflight
+            self._inflight_lock = FPLClient._shared_inflight_lock
+        else:
+            self._inflight: Dict[str, Future] = {}
+            self._inflight_lock = threading.Lock()
+
+        if prefetch:
+            self.prefetch()
+
+    @classmethod
+    def _get_shared_session(cls) -> requests.Session:
+        """Get the process-wide HTTP session, creating it on first use"""
+        with cls._session_lock:
+            if cls._shared_session is None:
+                session = requests.Session()
+                session.headers.update({
+                    'User-Agent': 'FPL-Analysis-Tool/1.0',
+                    # Every encoding urllib3 can decode here: gzip and deflate,
+                    # plus br when brotli/brotlicffi is installed (bootstrap-static
+                    # is ~1MB of JSON and compresses several times better with br)
+                    'Accept-Encoding': ACCEPT_ENCODING
+                })
+                # Keep enough pooled connections for the concurrent fetchers and
+                # retry transient server errors with a short backoff
+                adapter = HTTPAdapter(
+                    pool_connections=16,
+                    pool_maxsize=16,
+                    max_retries=Retry(
+                        total=3,
+                        backoff_factor=0.3,
+                        status_forcelist=[500, 502, 503, 504]
+                    )
+                )
+                session.mount('https://', adapter)
+                cls._shared_session = session
+            return cls._shared_session
 
     def _rate_limit(self):
-        """Ensure we don't make requests too quickly"""
-        current_time = time.time()
-        time_since_last = current_time - self.last_request_time
-        if time_since_last < self.min_request_interval:
-            time.sleep(self.min_request_interval - time_since_last)
-        self.last_request_time = time.time()
+        """Wait for a request token (safe to call from worker threads)"""
+        self._bucket.acquire()
 
     def _get_cached(self, key: str) -> Optional[Dict]:
-        """Get data from cache if still valid"""
-        if key in self.cache:
-            data, timestamp = self.cache[key]
-            if time.time() - timestamp < self.cache_duration:
-                return data
+        """
+        Get data from cache if still valid, falling back to the disk cache
+
+        Raises:
+            Exception: The cached error if this endpoint failed recently
+        """
+        # Entry ages are measured on the monotonic clock, so wall-clock
+        # adjustments can't make entries expire early or live too long
+        now = time.monotonic()
+        with self._cache_lock:
+            self._evict_expired(now)
+
+            error_entry = self._errors.get(key)
+            if error_entry:
+                if now - error_entry[1] < self.ERROR_CACHE_DURATION:
+                    raise error_entry[0]
+                del self._errors[key]
+
+            entry = self.cache.get(key)
+            if entry and now - entry[1] < self.cache_duration:
+                return entry[0]
+
+        # An expired entry in memory is only replaced if another process has
+        # refreshed the disk copy since; its payload is re-read only if the
+        # payload file itself changed
+        disk_entry = self._read_disk_cache(key, keep=entry[0] if entry else None)
+        if disk_entry:
+            data, timestamp, validators = disk_entry
+            # The disk cache is shared between processes, so it keeps wall-clock
+            # timestamps; convert the entry's age to the monotonic clock
+            stored_at = now - max(time.time() - timestamp, 0)
+            if entry is None or stored_at > entry[1] or data is not entry[0]:
+                # Keep stale entries too: their validators allow a conditional refresh
+                with self._cache_lock:
+                    self._store(key, data, stored_at, validators)
+                entry = (data, stored_at)
+        if entry and now - entry[1] < self.cache_duration:
+            return entry[0]
         return None
 
-    def _set_cache(self, key: str, data: Dict):
-        """Store data in cache"""
-        self.cache[key] = (data, time.time())
+    def _set_cache(self, key: str, data: Dict, validators: Optional[Dict[str, str]] = None,
+                   modified: bool = True):
+        """
+        Store data in cache, with the request headers used to revalidate it
+
+        Args:
+            key: Endpoint the data was fetched from
+            data: Frozen payload
+            validators: Conditional request headers for the next refresh
+            modified: False if the server confirmed the cached payload (304);
+                only its timestamp and validators are refreshed then
+        """
+        validators = validators or {}
+        with self._cache_lock:
+            self._evict_expired(time.monotonic())
+            self._store(key, data, time.monotonic(), validators)
+            self._errors.pop(key, None)
+        self._write_disk_cache(key, data if modified else None, time.time(), validators)
+
+    def _store(self, key: str, data: Any, stored_at: float, validators: Dict[str, str]):
+        """Put an entry in the memory cache and schedule its eviction (caller holds the lock)"""
+        self.cache[key] = (data, stored_at)
+        self._validators[key] = validators
+        evict_at = stored_at + self.cache_duration + self.STALE_RETENTION
+        heapq.heappush(self._expiry_heap, (evict_at, key, stored_at))
+
+    def _evict_expired(self, now: float):
+        """
+        Drop memory cache entries past their eviction time (caller holds the lock)
+
+        Each store pushes an (evict_at, key, stored_at) record onto the heap, so
+        only the records that are due are looked at. A record whose entry has
+        since been replaced no longer matches its stored_at and is just discarded.
+
+        Args:
+            now: Current time.monotonic() value
+        """
+        heap = self._expiry_heap
+        while heap and heap[0][0] <= now:
+            _, key, stored_at = heapq.heappop(heap)
+            entry = self.cache.get(key)
+            if entry and entry[1] == stored_at:
+                del self.cache[key]
+                self._validators.pop(key, None)
+
+    def _memoize(self, name: str, source: Any, build: Callable[[Any], Any]) -> Any:
+        """
+        Get a value derived from a cached payload, building it once per payload
+
+        The payload object acts as the version: a refetch caches a new object and
+        so invalidates everything derived from the old one, while a revalidated
+        (304) entry keeps its object and its derived values.
+
+        Args:
+            name: Name of the derived value
+            source: Cached payload (or part of one) the value is built from
+            build: Function building the value from source
+
+        Returns:
+            The derived value (shared between clients; treat as read-only)
+        """
+        entry = self._derived.get(name)
+        if entry is None or entry[0] is not source:
+            entry = (source, build(source))
+            self._derived[name] = entry
+        return entry[1]
+
+    def _get_index(self, name: str, items: Sequence[Dict]) -> Mapping[int, Dict]:
+        """
+        Get an ID -> item index over a cached list, building it on first use
+
+        Args:
+            name: Index name
+            items: Cached list the index is built from
+
+        Returns:
+            Read-only mapping of ID to item (rebuilt whenever a new list is cached)
+        """
+        return self._memoize(
+            name, items, lambda items: MappingProxyType({item['id']: item for item in items})
+        )
+
+    def _get_gameweeks(self) -> Mapping[str, Any]:
+        """
+        Get the current, next and finished gameweeks, derived in one pass
+
+        Returns:
+            Mapping with 'current' and 'next' gameweek numbers (or None) and the
+            tuple of 'finished' gameweek numbers, rebuilt whenever a new
+            bootstrap payload is cached
+        """
+        return self._memoize('gameweeks', self.get_bootstrap_static()['events'],
+                             self._derive_gameweeks)
+
+    @staticmethod
+    def _derive_gameweeks(events: Sequence[Dict]) -> Mapping[str, Any]:
+        """Find the current, next and finished gameweeks in a single loop over the events"""
+        current = next_gw = None
+        finished = []
+        for event in events:
+            if event['is_current']:
+                current = event['id']
+            if event['is_next']:
+                next_gw = event['id']
+            if event.get('finished'):
+                finished.append(event['id'])
+        return MappingProxyType({'current': current, 'next': next_gw, 'finished': tuple(finished)})
+
+    def _disk_cache_path(self, key: str) -> Optional[str]:
+        """
+        Get the disk cache payload file for an endpoint, or None if it isn't cached on disk
+
+        Each endpoint has a payload file and a small '.meta.json' file next to it
+        holding the timestamp and validators, so a revalidated entry can be
+        refreshed without rewriting or re-reading the payload.
+        """
+        if self.cache_dir is None or key not in self.PERSISTENT_ENDPOINTS:
+            return None
+        return os.path.join(self.cache_dir, key.strip('/').replace('/', '_') + '.json')
+
+    @staticmethod
+    def _meta_path(path: str) -> str:
+        """Get the metadata file that goes with a disk cache payload file"""
+        return path[:-len('.json')] + '.meta.json'
+
+    def _read_disk_cache(self, key: str, keep: Any = None) -> Optional[tuple]:
+        """
+        Read a (data, timestamp, validators) entry from the disk cache
+
+        Args:
+            key: Endpoint to read
+            keep: Payload already loaded in memory; it is returned as the entry's
+                data instead of parsing the payload file again if that file is
+                unchanged since it was loaded
+
+        Returns:
+            Entry with frozen data, or None if missing or unreadable
+        """
+        path = self._disk_cache_path(key)
+        if path is None:
+            return None
+        try:
+            with open(self._meta_path(path), 'rb') as f:
+                meta = _json_loads(f.read())
+            mtime = os.stat(path).st_mtime_ns
+            if keep is not None and self._disk_mtimes.get(path) == mtime:
+                data = keep
+            else:
+                with open(path, 'rb') as f:
+                    data = _freeze(_json_loads(f.read()))
+                self._disk_mtimes[path] = mtime
+            return data, meta['timestamp'], meta.get('validators', {})
+        except (OSError, ValueError, KeyError, TypeError):
+            # Missing or unreadable entries are treated as a cache miss
+            return None
+
+    def _write_disk_cache(self, key: str, data: Optional[Dict], timestamp: float,
+                          validators: Dict[str, str]):
+        """
+        Write an entry to the disk cache (best effort; failures are ignored)
 
-    def _make_request(self, endpoint: str, use_cache: bool = True) -> Dict:
+        Args:
+            key: Endpoint to write
+            data: Payload to write, or None to only refresh the metadata of the
+                payload already on disk
+            timestamp: Wall-clock time the entry was confirmed fresh
+            validators: Conditional request headers for the next refresh
+        """
+        path = self._disk_cache_path(key)
+        if path is None:
+            return
+        # The payload goes first: a reader that sees the new metadata also sees
+        # the payload it describes
+        if data is not None:
+            if not self._write_file(path, _json_dumps(data)):
+                return
+            try:
+                self._disk_mtimes[path] = os.stat(path).st_mtime_ns
+            except OSError:
+                return
+        self._write_file(self._meta_path(path), _json_dumps({
+            'timestamp': timestamp, 'validators': validators
+        }))
+
+    def _write_file(self, path: str, content: bytes) -> bool:
+        """Atomically replace a disk cache file, returning whether it was written"""
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            # Write to a temporary file and rename so readers never see a partial file
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        except OSError:
+            return False
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(content)
+            os.replace(tmp_path, path)
+            return True
+        except OSError:
+            os.remove(tmp_path)
+            return False
+
+    def _make_request(self, endpoint: str, use_cache: bool = True) -> Any:
         """
         Make HTTP request to FPL API
 
@@ -59,7 +473,7 @@ class FPLClient:
             use_cache: Whether to use cached response
 
         Returns:
-            JSON response as dictionary
+            Read-only JSON response, shared with other callers
         """
         # Check cache first
         if use_cache:
@@ -67,41 +481,173 @@ class FPLClient:
             if cached:
                 return cached
 
+        return self._fetch(endpoint, use_cache)
+
+    def _fetch(self, endpoint: str, use_cache: bool = True) -> Any:
+        """
+        Fetch an endpoint, sharing one HTTP request between concurrent callers
+
+        Args:
+            endpoint: API endpoint (without base URL)
+            use_cache: Whether to cache the response
+
+        Returns:
+            Decoded JSON response
+        """
+        future, owner = self._claim(endpoint)
+
+        # Another thread is already fetching this endpoint; wait for its result
+        if not owner:
+            return future.result()
+
+        return self._resolve(endpoint, future, use_cache)
+
+    def _claim(self, endpoint: str) -> tuple:
+        """
+        Get the in-flight request for an endpoint, registering a new one if none
+
+        Args:
+            endpoint: API endpoint (without base URL)
+
+        Returns:
+            Tuple of the request's Future and whether the caller owns it (and
+            must resolve it with _resolve)
+        """
+        with self._inflight_lock:
+            future = self._inflight.get(endpoint)
+            if future is not None:
+                return future, False
+            future = Future()
+            self._inflight[endpoint] = future
+            return future, True
+
+    def _resolve(self, endpoint: str, future: Future, use_cache: bool = True) -> Any:
+        """
+        Perform a claimed request and publish its result to waiting callers
+
+        Args:
+            endpoint: API endpoint (without base URL)
+            future: Future returned by _claim
+            use_cache: Whether to cache the response
+
+        Returns:
+            Decoded JSON response
+        """
+        # An expired copy can be revalidated instead of downloaded again
+        cached = None
+        if use_cache:
+            with self._cache_lock:
+                stale = self.cache.get(endpoint)
+                if stale:
+                    cached = (stale[0], self._validators.get(endpoint, {}))
+
+        try:
+            data, validators = self._http_get(endpoint, cached)
+            # A 304 hands back the cached payload object itself
+            modified = cached is None or data is not cached[0]
+            # Every caller shares the payload, so hand out a read-only view
+            data = _freeze(data)
+            # Cache the response before waiters are released
+            if use_cache:
+                self._set_cache(endpoint, data, validators, modified)
+            future.set_result(data)
+        except BaseException as e:
+            # Remember error responses briefly; network failures are not cached
+            if use_cache and isinstance(e.__cause__, (requests.exceptions.HTTPError,
+                                                      requests.exceptions.RetryError)):
+                with self._cache_lock:
+                    self._errors[endpoint] = (e, time.monotonic())
+            # Also reached on KeyboardInterrupt/SystemExit: waiters block on the
+            # future without a timeout, so it must be completed either way
+            future.set_exception(e)
+            raise
+        finally:
+            with self._inflight_lock:
+                del self._inflight[endpoint]
+
+        return data
+
+    def _http_get(self, endpoint: str, cached: Optional[tuple] = None) -> tuple:
+        """
+        Fetch an endpoint from the API, bypassing the cache
+
+        Args:
+            endpoint: API endpoint (without base URL)
+            cached: Optional (data, validators) of an expired copy to revalidate
+
+        Returns:
+            Tuple of decoded JSON response and the request headers to revalidate
+            it with (the cached data is returned if the server reports no change)
+        """
         # Rate limiting
         self._rate_limit()
 
         # Make request
         url = f"{self.BASE_URL}{endpoint}"
         try:
-            response = self.session.get(url, timeout=10)
+            headers = cached[1] if cached else None
+            response = self.session.get(url, headers=headers, timeout=10)
             response.raise_for_status()
-            data = response.json()
 
-            # Cache the response
-            if use_cache:
-                self._set_cache(endpoint, data)
+            validators = {}
+            if response.headers.get('ETag'):
+                validators['If-None-Match'] = response.headers['ETag']
+            if response.headers.get('Last-Modified'):
+                validators['If-Modified-Since'] = response.headers['Last-Modified']
+
+            if cached and response.status_code == 304:
+                # Unchanged: skip the body download and parse
+                return cached[0], validators or cached[1]
+            return _json_loads(response.content), validators
 
-            return data
+        except (requests.exceptions.RequestException, ValueError) as e:
+            raise Exception(f"FPL API request failed: {str(e)}") from e
+
+    def prefetch(self, endpoints: Iterable[str] = PERSISTENT_ENDPOINTS):
+        """
+        Start fetching endpoints in parallel in the background
 
-        except requests.exceptions.RequestException as e:
-            raise Exception(f"FPL API request failed: {str(e)}")
+        The requests are registered as in flight before this returns, so later
+        calls for the same endpoints wait for them instead of sending their own.
+        Errors surface on those calls.
 
-    def get_bootstrap_static(self, use_cache: bool = True) -> Dict:
+        Args:
+            endpoints: API endpoints to fetch (default: bootstrap-static and fixtures)
+        """
+        claimed = []
+        for endpoint in endpoints:
+            try:
+                if self._get_cached(endpoint):
+                    continue
+            except Exception:
+                continue  # failed recently; the next call re-raises the error
+            future, owner = self._claim(endpoint)
+            if owner:
+                claimed.append((endpoint, future))
+
+        if claimed:
+            executor = ThreadPoolExecutor(max_workers=len(claimed))
+            for endpoint, future in claimed:
+                executor.submit(self._resolve, endpoint, future)
+            # Worker threads exit once their request completes
+            executor.shutdown(wait=False)
+
+    def get_bootstrap_static(self, use_cache: bool = True) -> Mapping[str, Any]:
         """
         Get bootstrap-static data (all game data)
         Contains: teams, elements (players), element_types, events (gameweeks)
 
         Returns:
-            Dictionary with all FPL game data
+            Read-only mapping with all FPL game data
         """
         return self._make_request("/bootstrap-static/", use_cache)
 
-    def get_fixtures(self, use_cache: bool = True) -> List[Dict]:
+    def get_fixtures(self, use_cache: bool = True) -> Sequence[Dict]:
         """
         Get all fixtures (matches)
 
         Returns:
-            List of fixture dictionaries
+            Tuple of fixture dictionaries (shared; treat as read-only)
         """
         return self._make_request("/fixtures/", use_cache)
 
@@ -116,12 +662,17 @@ class FPLClient:
             Fixture details dictionary
         """
         fixtures = self.get_fixtures(use_cache)
-        for fixture in fixtures:
-            if fixture['id'] == fixture_id:
-                return fixture
-        raise ValueError(f"Fixture {fixture_id} not found")
-
-    def get_player_summary(self, player_id: int, use_cache: bool = True) -> Dict:
+        if use_cache:
+            fixture = self._get_index('fixtures', fixtures).get(fixture_id)
+        else:
+            # A one-off uncached list isn't worth indexing, and indexing it would
+            # replace the shared index over the cached list
+            fixture = next((f for f in fixtures if f['id'] == fixture_id), None)
+        if fixture is None:
+            raise ValueError(f"Fixture {fixture_id} not found")
+        return fixture
+
+    def get_player_summary(self, player_id: int, use_cache: bool = True) -> Mapping[str, Any]:
         """
         Get detailed player summary including history and fixtures
 
@@ -133,7 +684,90 @@ class FPLClient:
         """
         return self._make_request(f"/element-summary/{player_id}/", use_cache)
 
-    def get_live_gameweek(self, gameweek: int, use_cache: bool = False) -> Dict:
+    def get_player_summaries(self, player_ids: Iterable[int], concurrency: int = 8,
+                             use_cache: bool = True) -> Dict[int, Mapping[str, Any]]:
+        """
+        Get summaries for many players, fetching uncached ones concurrently
+
+        Args:
+            player_ids: Player element IDs
+            concurrency: Maximum number of requests in flight
+            use_cache: Whether to use and store cached responses
+
+        Returns:
+            Dictionary of player ID to summary, in the order requested
+        """
+        player_ids, summaries, pending = self._split_cached_summaries(player_ids, use_cache)
+
+        # Workers share the rate limiter, so only the network waits overlap
+        if pending:
+            with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                futures = {
+                    executor.submit(self._fetch, f"/element-summary/{player_id}/", use_cache): player_id
+                    for player_id in pending
+                }
+                for future in as_completed(futures):
+                    player_id = futures[future]
+                    summaries[player_id] = future.result()
+
+        return {player_id: summaries[player_id] for player_id in player_ids}
+
+    async def aget_player_summaries(self, player_ids: Iterable[int], concurrency: int = 8,
+                                    use_cache: bool = True) -> Dict[int, Mapping[str, Any]]:
+        """
+        Get summaries for many players from async code, fetching uncached ones concurrently
+
+        Requests run on worker threads through the shared session, so they use the
+        same cache, in-flight deduplication and rate limiter as the sync API.
+
+        Args:
+            player_ids: Player element IDs
+            concurrency: Maximum number of requests in flight
+            use_cache: Whether to use and store cached responses
+
+        Returns:
+            Dictionary of player ID to summary, in the order requested
+        """
+        player_ids, summaries, pending = self._split_cached_summaries(player_ids, use_cache)
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch(player_id: int):
+            async with semaphore:
+                summaries[player_id] = await asyncio.to_thread(
+                    self._fetch, f"/element-summary/{player_id}/", use_cache
+                )
+
+        await asyncio.gather(*(fetch(player_id) for player_id in pending))
+
+        return {player_id: summaries[player_id] for player_id in player_ids}
+
+    def _split_cached_summaries(self, player_ids: Iterable[int], use_cache: bool) -> tuple:
+        """
+        Split a batch of player IDs into cached summaries and IDs still to fetch
+
+        Args:
+            player_ids: Player element IDs
+            use_cache: Whether to look in the cache
+
+        Returns:
+            Tuple of (unique IDs in order, dictionary of cached summaries,
+            list of IDs to fetch)
+        """
+        player_ids = list(dict.fromkeys(player_ids))
+        summaries = {}
+
+        pending = []
+        for player_id in player_ids:
+            cached = self._get_cached(f"/element-summary/{player_id}/") if use_cache else None
+            if cached:
+                summaries[player_id] = cached
+            else:
+                pending.append(player_id)
+
+        return player_ids, summaries, pending
+
+    def get_live_gameweek(self, gameweek: int, use_cache: bool = False) -> Mapping[str, Any]:
         """
         Get live gameweek data (usually don't cache this)
 
@@ -153,11 +787,7 @@ class FPLClient:
         Returns:
             Current gameweek number or None if season not started
         """
-        data = self.get_bootstrap_static()
-        for event in data['events']:
-            if event['is_current']:
-                return event['id']
-        return None
+        return self._get_gameweeks()['current']
 
     def get_next_gameweek(self) -> Optional[int]:
         """
@@ -166,28 +796,33 @@ class FPLClient:
         Returns:
             Next gameweek number or None
         """
-        data = self.get_bootstrap_static()
-        for event in data['events']:
-            if event['is_next']:
-                return event['id']
-        return None
+        return self._get_gameweeks()['next']
 
-    def get_all_players(self) -> List[Dict]:
+    def get_finished_gameweeks(self) -> List[int]:
+        """
+        Get finished gameweek numbers
+
+        Returns:
+            List of finished gameweek numbers in season order
+        """
+        return list(self._get_gameweeks()['finished'])
+
+    def get_all_players(self) -> Sequence[Dict]:
         """
         Get all players data
 
         Returns:
-            List of all player dictionaries
+            Tuple of all player dictionaries (shared; treat as read-only)
         """
         data = self.get_bootstrap_static()
         return data['elements']
 
-    def get_all_teams(self) -> List[Dict]:
+    def get_all_teams(self) -> Sequence[Dict]:
         """
         Get all teams data
 
         Returns:
-            List of all team dictionaries
+            Tuple of all team dictionaries (shared; treat as read-only)
         """
         data = self.get_bootstrap_static()
         return data['teams']
@@ -202,11 +837,7 @@ class FPLClient:
         Returns:
             Player dictionary or None
         """
-        players = self.get_all_players()
-        for player in players:
-            if player['id'] == player_id:
-                return player
-        return None
+        return self._get_index('players', self.get_all_players()).get(player_id)
 
     def get_team_by_id(self, team_id: int) -> Optional[Dict]:
         """
@@ -218,15 +849,25 @@ class FPLClient:
         Returns:
             Team dictionary or None
         """
-        teams = self.get_all_teams()
-        for team in teams:
-            if team['id'] == team_id:
-                return team
-        return None
+        return self._get_index('teams', self.get_all_teams()).get(team_id)
 
     def clear_cache(self):
-        """Clear all cached data"""
-        self.cache = {}
+        """Clear all cached data, including the disk cache (and the shared cache if used)"""
+        with self._cache_lock:
+            self.cache.clear()
+            self._errors.clear()
+            self._validators.clear()
+            self._derived.clear()
+            self._expiry_heap.clear()
+            self._disk_mtimes.clear()
+        for key in self.PERSISTENT_ENDPOINTS:
+            path = self._disk_cache_path(key)
+            if path:
+                for file_path in (path, self._meta_path(path)):
+                    try:
+                        os.remove(file_path)
+                    except FileNotFoundError:
+                        pass
 
     def get_cache_info(self) -> Dict[str, Any]:
         """
@@ -242,7 +883,8 @@ class FPLClient:
         }
 
 
-if __name__ == "__main__":
+def _selftest():
+    """Smoke-test the client against the live FPL API"""
     # Quick test
     print("Testing FPL API Client...")
     client = FPLClient()
@@ -280,3 +922,15 @@ if __name__ == "__main__":
 
     except Exception as e:
         print(f"\n❌ Error: {str(e)}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="FPL API Client")
+    parser.add_argument('--selftest', action='store_true',
+                        help="run smoke tests against the live FPL API")
+    args = parser.parse_args()
+
+    if args.selftest:
+        _selftest()
+    else:
+        parser.print_help()
@@ -2,8 +2,16 @@
 Comprehensive Test Suite for FPL Analysis Project
 Tests all components: API client, analyzers, and integration
 """
+import asyncio
+import json
+import os
 import sys
+import tempfile
+import threading
 
+import requests
+
+from src.api import fpl_client
 from src.api.fpl_client import FPLClient
 from src.analysis.player_analyzer import PlayerAnalyzer
 from src.analysis.fixture_analyzer import FixtureAnalyzer
@@ -54,6 +62,21 @@ def test_fpl_client():
     assert cache_info['cached_endpoints'] > 0, "Cache not working"
     print(f"    ✓ Cached endpoints: {cache_info['cached_endpoints']}")
 
+    # Test 1.6: Batched player summaries
+    print("\n1.6 Testing batched player summaries...")
+    summaries = client.get_player_summaries([300, 301, 302])
+    assert list(summaries) == [300, 301, 302], "Summaries missing or out of order"
+    assert all('history' in s for s in summaries.values()), "Missing history"
+    assert summaries[300] is client.get_player_summary(300), "Summary not cached"
+    print(f"    ✓ Fetched {len(summaries)} summaries")
+
+    # Test 1.7: Async player summaries
+    print("\n1.7 Testing async player summaries...")
+    summaries = asyncio.run(client.aget_player_summaries([302, 303]))
+    assert list(summaries) == [302, 303], "Summaries missing or out of order"
+    assert summaries[303] is client.get_player_summary(303), "Summary not cached"
+    print(f"    ✓ Fetched {len(summaries)} summaries")
+
     print("\n✅ FPL Client: ALL TESTS PASSED")
     return True
 
@@ -255,6 +278,177 @@ def test_integration():
     return True
 
 
+def test_cache_revalidation():
+    """Test conditional refresh of expired cache entries (offline)"""
+    print("\n" + "="*60)
+    print("TEST 6: Cache Revalidation (offline)")
+    print("="*60)
+
+    payload = {'elements': [{'id': 1}, {'id': 2}], 'teams': [], 'events': []}
+
+    class FakeResponse:
+        def __init__(self, status_code, content=b''):
+            self.status_code = status_code
+            self.content = content
+            self.headers = {'ETag': '"v1"'}
+
+        def raise_for_status(self):
+            pass
+
+    class FakeSession:
+        """Serves the payload, or 304 when the client sends its ETag back"""
+        def __init__(self):
+            self.sent_headers = []
+
+        def get(self, url, headers=None, timeout=None):
+            self.sent_headers.append(headers)
+            if headers and headers.get('If-None-Match') == '"v1"':
+                return FakeResponse(304)
+            return FakeResponse(200, json.dumps(payload).encode())
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        client = FPLClient(cache_duration=300, cache_dir=cache_dir, share_cache=False)
+        client.session = FakeSession()
+
+        data = client.get_bootstrap_static()
+        index = client._get_index('players', data['elements'])
+        payload_file = os.path.join(cache_dir, 'bootstrap-static.json')
+        payload_mtime = os.stat(payload_file).st_mtime_ns
+        client.cache_duration = 0  # every entry is now expired
+
+        # Test 6.1: 304 keeps the cached payload
+        print("\n6.1 Testing 304 revalidation of an expired entry...")
+        parsed = []
+        json_loads = fpl_client._json_loads
+        fpl_client._json_loads = lambda raw: parsed.append(raw) or json_loads(raw)
+        try:
+            refreshed = client.get_bootstrap_static()
+        finally:
+            fpl_client._json_loads = json_loads
+        assert client.session.sent_headers[-1]['If-None-Match'] == '"v1"', "No conditional request"
+        assert refreshed is data, "Revalidated payload was replaced"
+        assert not any(b'elements' in raw for raw in parsed), "Payload parsed again"
+        assert client._get_index('players', refreshed['elements']) is index, "Index rebuilt"
+        assert os.stat(payload_file).st_mtime_ns == payload_mtime, "Payload file rewritten"
+        print("    ✓ Same payload and index after 304")
+
+        # Test 6.2: Fresh entry is served from cache
+        print("\n6.2 Testing refreshed entry is fresh again...")
+        client.cache_duration = 300
+        requests_sent = len(client.session.sent_headers)
+        assert client.get_bootstrap_static() is data, "Refreshed entry not cached"
+        assert len(client.session.sent_headers) == requests_sent, "Fresh entry refetched"
+        print("    ✓ No request for a fresh entry")
+
+    print("\n✅ Cache Revalidation: ALL TESTS PASSED")
+    return True
+
+
+def test_request_sharing():
+    """Test single-flight requests and the error cache (offline)"""
+    print("\n" + "="*60)
+    print("TEST 7: Request Sharing (offline)")
+    print("="*60)
+
+    class FakeResponse:
+        def __init__(self, status_code, content=b'[]'):
+            self.status_code = status_code
+            self.content = content
+            self.headers = {}
+
+        def raise_for_status(self):
+            if self.status_code >= 400:
+                raise requests.exceptions.HTTPError(f"{self.status_code} Error")
+
+    class FakeSession:
+        """Answers from a callback, after the test releases the request"""
+        def __init__(self, respond):
+            self.respond = respond
+            self.urls = []
+            self.started = threading.Event()
+            self.release = threading.Event()
+            self.release.set()
+
+        def get(self, url, headers=None, timeout=None):
+            self.urls.append(url)
+            self.started.set()
+            assert self.release.wait(5), "Request never released"
+            return self.respond()
+
+    def concurrent_callers(client, call):
+        """Run call twice, the second time while the first is in flight"""
+        joined = threading.Event()
+        claim = client._claim
+
+        def claim_and_signal(endpoint):
+            future, owner = claim(endpoint)
+            if not owner:
+                joined.set()
+            return future, owner
+
+        client._claim = claim_and_signal
+        client.session.release.clear()
+        outcomes = []
+
+        def run():
+            try:
+                outcomes.append(call())
+            except BaseException as e:
+                outcomes.append(e)
+
+        owner = threading.Thread(target=run, daemon=True)
+        owner.start()
+        assert client.session.started.wait(5), "Request not sent"
+        waiter = threading.Thread(target=run, daemon=True)
+        waiter.start()
+        assert joined.wait(5), "Second caller did not join the request"
+        client.session.release.set()
+        for thread in (owner, waiter):
+            thread.join(5)
+            assert not thread.is_alive(), "Caller still blocked"
+        return outcomes
+
+    # Test 7.1: Concurrent callers share one request
+    print("\n7.1 Testing concurrent callers share one request...")
+    client = FPLClient(cache_dir=None, share_cache=False)
+    client.session = FakeSession(lambda: FakeResponse(200, b'[{"id": 1}]'))
+    outcomes = concurrent_callers(client, client.get_fixtures)
+    assert len(client.session.urls) == 1, "Concurrent callers sent separate requests"
+    assert outcomes[0] is outcomes[1], "Callers got different payloads"
+    print("    ✓ 2 callers, 1 request")
+
+    # Test 7.2: An interrupted request still releases its waiters
+    print("\n7.2 Testing an interrupted request releases waiters...")
+
+    def interrupt():
+        raise KeyboardInterrupt
+
+    client = FPLClient(cache_dir=None, share_cache=False)
+    client.session = FakeSession(interrupt)
+    outcomes = concurrent_callers(client, client.get_fixtures)
+    assert all(isinstance(o, KeyboardInterrupt) for o in outcomes), "Waiter not released"
+    assert not client._inflight, "Interrupted request left in flight"
+    print("    ✓ Waiter got the interruption")
+
+    # Test 7.3: Error responses are cached briefly
+    print("\n7.3 Testing a 404 is re-raised from cache...")
+    client = FPLClient(cache_dir=None, share_cache=False)
+    client.session = FakeSession(lambda: FakeResponse(404))
+    errors = []
+    for _ in range(2):
+        try:
+            client.get_player_summary(999999)
+        except Exception as e:
+            errors.append(e)
+    assert len(errors) == 2, "404 did not raise"
+    assert len(client.session.urls) == 1, "Cached 404 requested again"
+    assert errors[1] is errors[0], "Cached error not re-raised"
+    print("    ✓ 1 request for 2 lookups")
+
+    print("\n✅ Request Sharing: ALL TESTS PASSED")
+    return True
+
+
 def run_all_tests():
     """Run all test suites"""
     print("\n" + "="*60)
@@ -294,6 +488,18 @@ def run_all_tests():
         print(f"\n❌ Integration FAILED: {str(e)}")
         results.append(("Integration", False))
 
+    try:
+        results.append(("Cache Revalidation", test_cache_revalidation()))
+    except Exception as e:
+        print(f"\n❌ Cache Revalidation FAILED: {str(e)}")
+        results.append(("Cache Revalidation", False))
+
+    try:
+        results.append(("Request Sharing", test_request_sharing()))
+    except Exception as e:
+        print(f"\n❌ Request Sharing FAILED: {str(e)}")
+        results.append(("Request Sharing", False))
+
     # Summary
     print("\n" + "="*60)
     print("TEST SUMMARY")